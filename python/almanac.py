@@ -0,0 +1,149 @@
+from __future__ import annotations
+from bisect import bisect_right
+from collections.abc import Iterable
+from dataclasses import dataclass
+import numpy as np
+
+# The almanac of day 5. A map shifts the values from breaks[k] up to
+# breaks[k + 1] by offsets[k], for every k, and values are never negative, so
+# breaks[0] is always 0. The seven maps are composed once into a single map from
+# seeds straight to locations, which answers lookups in both directions and the
+# lowest location of ranges of seeds without going through the stages again.
+#
+# Sets of values are sorted, disjoint ranges [starts[i], ends[i]).
+
+type Ranges = tuple[np.ndarray, np.ndarray]
+
+
+@dataclass
+class Map:
+    breaks: list[int]
+    offsets: list[int]
+
+    @staticmethod
+    def of(pieces: Iterable[tuple[int, int]]) -> Map:
+        # Joins neighbouring pieces with the same offset.
+        map = Map([], [])
+        for start, offset in pieces:
+            if map.breaks and map.breaks[-1] == start:  # The last piece is empty.
+                map.breaks.pop()
+                map.offsets.pop()
+            if map.offsets and map.offsets[-1] == offset:
+                continue
+            map.breaks.append(start)
+            map.offsets.append(offset)
+        return map
+
+    @staticmethod
+    def parse(lines: Iterable[str]) -> Map:
+        entries = []
+        for line in lines:
+            [dest, source, length] = [int(word) for word in line.split()]
+            entries.append((source, source + length, dest - source))
+        pieces = [(0, 0)]
+        for source, end, offset in sorted(entries):
+            pieces.append((source, offset))
+            pieces.append((end, 0))
+        return Map.of(pieces)
+
+    def __getitem__(self, source: int) -> int:
+        return source + self.offsets[bisect_right(self.breaks, source) - 1]
+
+    def compose(self, other: Map) -> Map:
+        # The map that applies this one and then `other`: every piece of this
+        # one is cut where its shifted values cross a break of `other`.
+        pieces = []
+        ends = self.breaks[1:] + [None]
+        for start, end, offset in zip(self.breaks, ends, self.offsets):
+            k = bisect_right(other.breaks, start + offset) - 1
+            pieces.append((start, offset + other.offsets[k]))
+            for k in range(k + 1, len(other.breaks)):
+                cut = other.breaks[k] - offset
+                if end is not None and cut >= end:
+                    break
+                pieces.append((cut, offset + other.offsets[k]))
+        return Map.of(pieces)
+
+
+IDENTITY = Map([0], [0])
+
+
+def condense(starts: np.ndarray, ends: np.ndarray) -> Ranges:
+    # A range starts a new one unless it begins before the furthest end so far.
+    if len(starts) == 0:
+        return (starts, ends)
+    order = np.argsort(starts, kind="stable")
+    (starts, ends) = (starts[order], ends[order])
+    furthest = np.maximum.accumulate(ends)
+    new = np.ones(len(starts), dtype=bool)
+    new[1:] = starts[1:] > furthest[:-1]
+    firsts = np.flatnonzero(new)
+    lasts = np.append(firsts[1:] - 1, len(starts) - 1)
+    return (starts[firsts], furthest[lasts])
+
+
+def transform(starts: np.ndarray, ends: np.ndarray, map: Ranges) -> Ranges:
+    # Cuts the ranges at the breaks inside them, so that each piece moves by one
+    # offset. A cut inside range i ends a piece just before ends[i] and starts
+    # one just after starts[i].
+    (breaks, offsets) = map
+    within = np.searchsorted(ends, breaks, side="right")
+    inside = within < len(starts)
+    inside[inside] = starts[within[inside]] < breaks[inside]
+    (cuts, within) = (breaks[inside], within[inside])
+    starts = np.insert(starts, within + 1, cuts)
+    ends = np.insert(ends, within, cuts)
+    shift = offsets[np.searchsorted(breaks, starts, side="right") - 1]
+    return condense(starts + shift, ends + shift)
+
+
+@dataclass
+class Almanac:
+    seeds: np.ndarray
+    breaks: np.ndarray  # The composed map from seeds to locations.
+    offsets: np.ndarray
+
+    @staticmethod
+    def parse(text: str) -> Almanac:
+        [first, *blocks] = text.strip().split("\n\n")
+        seeds = [int(word) for word in first.split()[1:]]
+        location = IDENTITY
+        for block in blocks:
+            (_, *lines) = block.strip().splitlines()
+            location = location.compose(Map.parse(lines))
+        return Almanac(
+            np.array(seeds, dtype=np.int64),
+            np.array(location.breaks, dtype=np.int64),
+            np.array(location.offsets, dtype=np.int64),
+        )
+
+    @staticmethod
+    def load(path: str) -> Almanac:
+        with np.load(path) as arrays:
+            return Almanac(arrays["seeds"], arrays["breaks"], arrays["offsets"])
+
+    def save(self, path: str) -> None:
+        with open(path, "wb") as file:
+            np.savez(file, seeds=self.seeds, breaks=self.breaks, offsets=self.offsets)
+
+    def location(self, seeds: np.ndarray | int) -> np.ndarray:
+        seeds = np.asarray(seeds, dtype=np.int64)
+        return seeds + self.offsets[np.searchsorted(self.breaks, seeds, "right") - 1]
+
+    def locations(self, starts: np.ndarray, ends: np.ndarray) -> Ranges:
+        # The locations of the seeds in the ranges, which may overlap.
+        (starts, ends) = condense(np.asarray(starts), np.asarray(ends))
+        return transform(starts, ends, (self.breaks, self.offsets))
+
+    def lowest(self, starts: np.ndarray, ends: np.ndarray) -> int:
+        (locations, _) = self.locations(starts, ends)
+        if len(locations) == 0:
+            raise ValueError("no seeds")
+        return int(locations[0])
+
+    def seeds_at(self, location: int) -> list[int]:
+        # The seeds that end up at a location: at most one per piece of the map.
+        seeds = location - self.offsets
+        ends = np.append(self.breaks[1:], np.iinfo(np.int64).max)
+        found = (self.breaks <= seeds) & (seeds < ends)
+        return seeds[found].tolist()
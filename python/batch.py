@@ -0,0 +1,116 @@
+from __future__ import annotations
+import argparse
+import contextlib
+import importlib
+import io
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import runner
+
+# Runs the solvers of a day on many inputs, e.g. those of every user, and writes
+# a JSON line per solver and input as they finish. Every worker imports the
+# solvers once and keeps them for all of its inputs, so whatever they set up on
+# import, like day19's and day24's compiled regexes, carries over from one input
+# to the next. Their caches do not: answers for one input are of no use for
+# another, and day12b's alone would grow with every input a worker handles.
+
+
+def read_manifest(path: str) -> list[str]:
+    # One input per line, relative to the manifest. Blank lines and lines that
+    # start with "#" are skipped.
+    base = os.path.dirname(os.path.abspath(path))
+    with open(path) as file:
+        lines = [line.strip() for line in file]
+    return [os.path.join(base, line) for line in lines if line and line[0] != "#"]
+
+
+def find_inputs(source: str) -> list[str]:
+    if not os.path.isdir(source):
+        return read_manifest(source)
+    paths = (os.path.join(source, file) for file in sorted(os.listdir(source)))
+    return [path for path in paths if os.path.isfile(path)]
+
+
+def warm_up(names: list[str]) -> None:
+    runner.setup_path()
+    with contextlib.redirect_stdout(io.StringIO()):
+        for name in names:
+            importlib.import_module(name)
+
+
+def solve_one(name: str, path: str) -> dict[str, object]:
+    runner.clear_caches(importlib.import_module(name))
+    result = runner.run_solver(name, path=path)
+    return {
+        "solver": name,
+        "input": path,
+        "answer": result.answer,
+        "error": result.error,
+        "parse_time": result.parse_time,
+        "solve_time": result.solve_time,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        prog="python -m batch", description="Run a day's solvers on many inputs."
+    )
+    parser.add_argument("day", metavar="DAY", help="solver name prefix, e.g. day19")
+    parser.add_argument(
+        "source", metavar="INPUTS", help="directory of inputs or manifest listing them"
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=runner.positive_int,
+        metavar="N",
+        help="number of worker processes, one per CPU by default",
+    )
+    parser.add_argument(
+        "-o", "--output", metavar="PATH", help="write the JSON lines here, not stdout"
+    )
+    args = parser.parse_args()
+
+    runner.setup_path()
+    names = runner.discover([args.day])
+    if not names:
+        sys.exit(f"no solvers match {args.day}")
+    inputs = find_inputs(args.source)
+    if not inputs:
+        sys.exit(f"no inputs in {args.source}")
+    tasks = [(name, path) for path in inputs for name in names]
+    jobs = args.jobs or os.cpu_count() or 1
+
+    errors = 0
+    start = time.perf_counter()
+    with contextlib.ExitStack() as stack:
+        output = sys.stdout
+        if args.output is not None:
+            output = stack.enter_context(open(args.output, "w"))
+        if jobs == 1:
+            warm_up(names)
+            results = (solve_one(name, path) for (name, path) in tasks)
+        else:
+            pool = stack.enter_context(
+                ProcessPoolExecutor(jobs, initializer=warm_up, initargs=(names,))
+            )
+            results = pool.map(solve_one, *zip(*tasks))
+        for result in results:
+            errors += result["error"] is not None
+            output.write(json.dumps(result) + "\n")
+            output.flush()
+    elapsed = time.perf_counter() - start
+    print(
+        f"{len(tasks)} runs on {len(inputs)} inputs, {errors} failed, "
+        f"in {1000 * elapsed:.1f} ms with {jobs} job(s)",
+        file=sys.stderr,
+    )
+    sys.exit(1 if errors else 0)
+
+
+if __name__ == "__main__":
+    main()
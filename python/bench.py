@@ -0,0 +1,180 @@
+from __future__ import annotations
+import argparse
+import json
+import math
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+import traceback
+from dataclasses import asdict, dataclass
+
+import runner
+
+BASELINE_PATH = os.path.join(runner.PYTHON_DIR, "bench_baseline.json")
+# Differences below these are noise, however large they are in relative terms.
+MIN_TIME_DELTA = 0.005
+MIN_MEMORY_DELTA = 2**20
+
+
+@dataclass
+class Stats:
+    runs: int
+    median: float
+    p95: float
+    peak_memory: int | None
+
+
+def percentile(samples: list[float], p: float) -> float:
+    ordered = sorted(samples)
+    return ordered[max(0, math.ceil(p * len(ordered)) - 1)]
+
+
+def measure(name: str, repeat: int, budget: float, memory: bool) -> Stats:
+    call = runner.prepare(name)
+    samples = []
+    while len(samples) < repeat and (not samples or sum(samples) < budget):
+        start = time.perf_counter()
+        call()
+        samples.append(time.perf_counter() - start)
+    peak_memory = None
+    if memory:
+        # Tracing slows everything down, so it gets a separate, untimed run.
+        tracemalloc.start()
+        try:
+            call()
+            (_, peak_memory) = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+    return Stats(
+        len(samples), statistics.median(samples), percentile(samples, 0.95), peak_memory
+    )
+
+
+def load_baseline(path: str) -> dict[str, Stats]:
+    if not os.path.exists(path):
+        return {}
+    with open(path) as file:
+        return {name: Stats(**stats) for name, stats in json.load(file).items()}
+
+
+def save_baseline(path: str, baseline: dict[str, Stats]) -> None:
+    with open(path, "w") as file:
+        json.dump(
+            {name: asdict(baseline[name]) for name in sorted(baseline)}, file, indent=2
+        )
+        file.write("\n")
+
+
+def regressions(stats: Stats, base: Stats, threshold: float) -> list[str]:
+    result = []
+    if stats.median > max(base.median * (1 + threshold), base.median + MIN_TIME_DELTA):
+        result.append("time")
+    if (
+        stats.peak_memory is not None
+        and base.peak_memory is not None
+        and stats.peak_memory
+        > max(base.peak_memory * (1 + threshold), base.peak_memory + MIN_MEMORY_DELTA)
+    ):
+        result.append("memory")
+    return result
+
+
+def format_change(new: float | None, old: float | None) -> str:
+    if new is None or old is None or old == 0:
+        return "-"
+    return f"{100 * (new / old - 1):+.0f}%"
+
+
+def is_missing_package(exc: Exception) -> bool:
+    # Solvers that need an optional package, like networkx or z3, are skipped
+    # where it is not installed. A missing module of our own is a failure.
+    if not isinstance(exc, ModuleNotFoundError) or exc.name is None:
+        return False
+    top = exc.name.partition(".")[0]
+    return not os.path.exists(os.path.join(runner.PYTHON_DIR, f"{top}.py"))
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        prog="python -m bench",
+        description="Benchmark the solvers on their real inputs and compare the "
+        "results against a stored baseline.",
+    )
+    parser.add_argument("patterns", nargs="*", metavar="DAY")
+    parser.add_argument("-n", "--repeat", type=int, default=5, help="runs per solver")
+    parser.add_argument(
+        "--budget",
+        type=float,
+        default=60.0,
+        metavar="SECONDS",
+        help="stop repeating a solver once its runs took this long in total",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.25,
+        help="relative slowdown or memory growth that counts as a regression",
+    )
+    parser.add_argument("--baseline", default=BASELINE_PATH, metavar="PATH")
+    parser.add_argument(
+        "--update", action="store_true", help="store the results as the new baseline"
+    )
+    parser.add_argument(
+        "--no-memory", action="store_true", help="skip the peak memory measurement"
+    )
+    args = parser.parse_args()
+
+    runner.setup_path()
+    baseline = load_baseline(args.baseline)
+    failed = []
+    crashed = []
+    print(
+        f"{'solver':8}  {'runs':>4}  {'median':>10}  {'p95':>10}  {'peak MiB':>8}  "
+        f"{'time':>6}  {'memory':>6}  status"
+    )
+    for name in runner.discover(args.patterns):
+        try:
+            stats = measure(name, args.repeat, args.budget, not args.no_memory)
+        except Exception as exc:
+            error = "".join(traceback.format_exception_only(exc)).strip()
+            if is_missing_package(exc):
+                print(f"{name:8}  skipped: {error}")
+            else:
+                print(f"{name:8}  FAILED: {error}")
+                crashed.append(name)
+            continue
+        base = baseline.get(name)
+        if base is None:
+            status = "new"
+        elif problems := regressions(stats, base, args.threshold):
+            status = "REGRESSED (" + ", ".join(problems) + ")"
+            failed.append(name)
+        else:
+            status = "ok"
+        memory = (
+            "-" if stats.peak_memory is None else f"{stats.peak_memory / 2**20:.1f}"
+        )
+        time_change = format_change(stats.median, base and base.median)
+        memory_change = format_change(stats.peak_memory, base and base.peak_memory)
+        print(
+            f"{name:8}  {stats.runs:4}  {1000 * stats.median:8.1f}ms  "
+            f"{1000 * stats.p95:8.1f}ms  {memory:>8}  "
+            f"{time_change:>6}  {memory_change:>6}  {status}"
+        )
+        if args.update:
+            baseline[name] = stats
+
+    if args.update:
+        save_baseline(args.baseline, baseline)
+    elif failed:
+        print(f"regressions: {', '.join(failed)}")
+    if crashed:
+        print(f"failures: {', '.join(crashed)}")
+    if crashed or (failed and not args.update):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
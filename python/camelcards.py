@@ -0,0 +1,49 @@
+import numpy as np
+
+# Hands of Camel Cards packed into one integer each, written in hex: the type of
+# the hand, then its five cards, so that comparing the integers ranks the hands
+# by type and then card by card, under the plain rules as well as the joker rule.
+# The keys of all hands are worked out at once, from tables indexed by the cards
+# and by a number that tells the types apart: the sum over the cards of how
+# often each one occurs in the hand, e.g. 2 + 2 + 1 + 1 + 1 = 7 for one pair.
+
+TYPES = np.zeros(26, dtype=np.int64)
+TYPES[[5, 7, 9, 11, 13, 17, 25]] = range(1, 8)
+
+
+def card_values(order: str) -> np.ndarray:
+    values = np.zeros(256, dtype=np.int64)
+    values[list(order.encode())] = range(1, len(order) + 1)
+    return values
+
+
+PLAIN = card_values("23456789TJQKA")
+JOKERS = card_values("J23456789TQKA")
+
+
+def keys(hands: np.ndarray, jokers: bool = False) -> np.ndarray:
+    # The keys of the hands, given as rows of five ASCII cards.
+    cards = (JOKERS if jokers else PLAIN)[hands]
+    same = cards[:, :, None] == cards[:, None, :]
+    if jokers:
+        # The jokers are best spent on more of the most common other card.
+        joker = cards == 1
+        same &= ~joker[:, :, None] & ~joker[:, None, :]
+        counts = same.sum(axis=2)
+        most = counts.max(axis=1)
+        spread = counts.sum(axis=1) - most**2 + (most + joker.sum(axis=1)) ** 2
+    else:
+        spread = same.sum(axis=(1, 2))
+    key = TYPES[spread]
+    for i in range(5):
+        key = key << 4 | cards[:, i]
+    return key
+
+
+def winnings(data: bytes, jokers: bool = False) -> int:
+    # A stable sort of the keys ranks the hands, keeping equal ones in order.
+    tokens = bytes(data).split()
+    hands = np.frombuffer(b"".join(tokens[0::2]), dtype=np.uint8).reshape(-1, 5)
+    bets = np.array(tokens[1::2]).astype(np.int64)
+    order = np.argsort(keys(hands, jokers), kind="stable")
+    return int(bets[order] @ np.arange(1, len(order) + 1))
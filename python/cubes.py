@@ -0,0 +1,51 @@
+from __future__ import annotations
+import re
+from dataclasses import dataclass
+import numpy as np
+
+# The games of day 2 reduced to the most cubes of each colour shown at once,
+# one (red, green, blue) row per game, which is all either part asks about. The
+# index is built in a single regex pass over the log and then answers any number
+# of bags at once.
+
+COLORS = {b"red": 0, b"green": 1, b"blue": 2}
+TOKEN_RE = re.compile(rb"Game (\d+)|(\d+) (red|green|blue)")
+
+
+@dataclass
+class Games:
+    ids: np.ndarray  # (games,)
+    maxima: np.ndarray  # (games, 3)
+
+    @staticmethod
+    def parse(data: bytes) -> Games:
+        ids = list[int]()
+        maxima = list[list[int]]()
+        for m in TOKEN_RE.finditer(data):
+            if m[1] is not None:
+                ids.append(int(m[1]))
+                maxima.append([0, 0, 0])
+            else:
+                row = maxima[-1]
+                color = COLORS[m[3]]
+                row[color] = max(row[color], int(m[2]))
+        return Games(
+            np.array(ids, dtype=np.int64),
+            np.array(maxima, dtype=np.int64).reshape(-1, 3),
+        )
+
+    def possible(self, bags: np.ndarray | tuple[int, int, int]) -> np.ndarray:
+        # The sum of the ids of the games that each of the bags, given as rows of
+        # (red, green, blue), could have been used for.
+        bags = np.asarray(bags, dtype=np.int64).reshape(-1, 3)
+        result = np.empty(len(bags), dtype=np.int64)
+        # Compares chunks of bags with all games, to bound the temporary arrays.
+        step = max(1, 2**20 // max(1, len(self.ids)))
+        for start in range(0, len(bags), step):
+            chunk = bags[start : start + step]
+            fits = (self.maxima[None, :, :] <= chunk[:, None, :]).all(axis=2)
+            result[start : start + step] = fits @ self.ids
+        return result
+
+    def power_sum(self) -> int:
+        return int(self.maxima.prod(axis=1).sum())
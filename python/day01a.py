@@ -1,4 +1,6 @@
-import io
+import numpy as np
+import rawinput
+import selftest
 
 DAY = 1
 EXAMPLE_INPUT = """1abc2
@@ -8,22 +10,36 @@ treb7uchet"""
 EXAMPLE_OUTPUT = 142
 
 
-def solve(reader: io.TextIOBase) -> int:
-    result = 0
-    for line in reader:
-        digits = list(c for c in line if c.isdigit())
-        result += 10 * int(digits[0]) + int(digits[-1])
-    return result
+def solve(data: bytes) -> int:
+    # Works on the whole file at once: find the positions of all digits, then
+    # look up the first one at or after each line's start and the last one
+    # before its end.
+    chars = np.frombuffer(data, dtype=np.uint8)
+    newlines = np.flatnonzero(chars == ord("\n"))
+    starts = np.insert(newlines + 1, 0, 0)
+    ends = np.append(newlines, len(chars))
+    if starts[-1] == len(chars):  # The file ends with a newline.
+        (starts, ends) = (starts[:-1], ends[:-1])
+    digits = np.flatnonzero(chars - np.uint8(ord("0")) < 10)
+    first = np.searchsorted(digits, starts)
+    last = np.searchsorted(digits, ends) - 1
+    if np.any(first > last):
+        raise ValueError("line does not contain digit")
+    values = chars[digits] - np.uint8(ord("0"))
+    return 10 * int(values[first].sum()) + int(values[last].sum())
 
 
-assert solve(io.StringIO(EXAMPLE_INPUT)) == EXAMPLE_OUTPUT
+@selftest.register
+def test_example() -> None:
+    assert solve(EXAMPLE_INPUT.encode()) == EXAMPLE_OUTPUT
 
 
 def main():
-    with open(f"input/day{DAY:02}.txt") as file:
-        solution = solve(file)
+    with rawinput.load(f"input/day{DAY:02}.txt") as data:
+        solution = solve(data)
         print(solution)
 
 
 if __name__ == "__main__":
+    selftest.run(__name__)
     main()
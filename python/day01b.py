@@ -1,4 +1,7 @@
-import io
+from collections.abc import Iterable
+from functools import cache
+import rawinput
+import selftest
 
 DAY = 1
 EXAMPLE_INPUT = """two1nine
@@ -24,37 +27,88 @@ DIGITS = {
 } | {str(i): i for i in range(10)}
 
 
-def find_first_digit(line: str) -> int:
-    for i in range(len(line)):
-        for name, value in DIGITS.items():
-            if line.startswith(name, i):
-                return value
-    raise ValueError("line does not contain digit")
+def automaton(words: dict[bytes, int]) -> list[int]:
+    # An Aho-Corasick automaton over bytes, completed into a DFA. States are
+    # numbered in steps of 256, and the state after reading a byte is
+    # delta[state + byte], or ~value as soon as a word ends there. Since no word
+    # occurs inside another, the first word to end is also the first to start.
+    children = [dict[int, int]()]
+    values = [-1]
+    for word, value in words.items():
+        node = 0
+        for byte in word:
+            if byte not in children[node]:
+                children[node][byte] = len(children)
+                children.append({})
+                values.append(-1)
+            node = children[node][byte]
+        values[node] = value
+
+    delta = [0] * (256 * len(children))
+    fail = [0] * len(children)
+    queue = [0]
+    for node in queue:
+        (row, fallback) = (256 * node, 256 * fail[node])
+        if node != 0:
+            if values[node] < 0:
+                values[node] = values[fail[node]]
+            # Bytes that extend no word go where they go from the fail state.
+            delta[row : row + 256] = delta[fallback : fallback + 256]
+        for byte, child in children[node].items():
+            fail[child] = 0 if node == 0 else delta[fallback + byte] // 256
+            delta[row + byte] = 256 * child
+            queue.append(child)
+    return [
+        state if values[state // 256] < 0 else ~values[state // 256] for state in delta
+    ]
+
+
+@cache
+def automata() -> tuple[list[int], list[int]]:
+    # The automata for the names and for their reversals, built on first use
+    # rather than on import.
+    forward = automaton({name.encode(): value for name, value in DIGITS.items()})
+    backward = automaton({name.encode()[::-1]: value for name, value in DIGITS.items()})
+    return (forward, backward)
 
 
-def find_last_digit(line: str) -> int:
-    for i in range(len(line), 0, -1):
-        for name, value in DIGITS.items():
-            if line.endswith(name, 0, i):
-                return value
+def scan(delta: list[int], data: Iterable[int]) -> int:
+    state = 0
+    for byte in data:
+        state = delta[state + byte]
+        if state < 0:
+            return ~state
     raise ValueError("line does not contain digit")
 
 
-def solve(reader: io.TextIOBase) -> int:
+def find_first_digit(line: memoryview) -> int:
+    (forward, _) = automata()
+    return scan(forward, line)
+
+
+def find_last_digit(line: memoryview) -> int:
+    (_, backward) = automata()
+    return scan(backward, reversed(line))
+
+
+def solve(data: bytes) -> int:
     result = 0
-    for line in reader:
+    for line in rawinput.lines(data):
         result += 10 * find_first_digit(line) + find_last_digit(line)
     return result
 
 
-assert solve(io.StringIO(EXAMPLE_INPUT)) == EXAMPLE_OUTPUT
+@selftest.register
+def test_example() -> None:
+    assert solve(EXAMPLE_INPUT.encode()) == EXAMPLE_OUTPUT
 
 
 def main():
-    with open(f"input/day{DAY:02}.txt") as file:
-        solution = solve(file)
+    with rawinput.load(f"input/day{DAY:02}.txt") as data:
+        solution = solve(data)
         print(solution)
 
 
 if __name__ == "__main__":
+    selftest.run(__name__)
     main()
@@ -1,4 +1,6 @@
-import io
+from cubes import Games
+import rawinput
+import selftest
 
 DAY = 2
 EXAMPLE_INPUT = """Game 1: 3 blue, 4 red; 1 red, 2 green, 6 blue; 2 green
@@ -9,33 +11,31 @@ Game 5: 6 red, 1 blue, 3 green; 2 blue, 1 red, 2 green"""
 EXAMPLE_OUTPUT = 8
 
 
-LIMITS = dict(red=12, green=13, blue=14)
+LIMITS = (12, 13, 14)  # Red, green and blue.
 
 
-def analyse_game(game: str) -> int:
-    [label, rounds] = game.split(":", maxsplit=1)
-    id = int(label.split()[1])
-    for round in rounds.split(";"):
-        for info in round.split(","):
-            [count, color] = info.strip().split(maxsplit=1)
-            if int(count) > LIMITS[color]:
-                return 0
+def solve(data: bytes) -> int:
+    return int(Games.parse(data).possible(LIMITS)[0])
 
-    return id
 
+@selftest.register
+def test_example() -> None:
+    assert solve(EXAMPLE_INPUT.encode()) == EXAMPLE_OUTPUT
 
-def solve(reader: io.TextIOBase) -> int:
-    return sum(analyse_game(line) for line in reader)
 
-
-assert solve(io.StringIO(EXAMPLE_INPUT)) == EXAMPLE_OUTPUT
+@selftest.register
+def test_many_bags() -> None:
+    games = Games.parse(EXAMPLE_INPUT.encode())
+    bags = [LIMITS, (0, 0, 0), (20, 13, 15), (4, 3, 6)]
+    assert games.possible(bags).tolist() == [8, 0, 15, 3]
 
 
 def main():
-    with open(f"input/day{DAY:02}.txt") as file:
-        solution = solve(file)
+    with rawinput.load(f"input/day{DAY:02}.txt") as data:
+        solution = solve(data)
         print(solution)
 
 
 if __name__ == "__main__":
+    selftest.run(__name__)
     main()
@@ -1,5 +1,6 @@
-import io
-import math
+from cubes import Games
+import rawinput
+import selftest
 
 DAY = 2
 EXAMPLE_INPUT = """Game 1: 3 blue, 4 red; 1 red, 2 green, 6 blue; 2 green
@@ -10,29 +11,21 @@ Game 5: 6 red, 1 blue, 3 green; 2 blue, 1 red, 2 green"""
 EXAMPLE_OUTPUT = 2286
 
 
-def analyse_game(game: str) -> int:
-    maxs = dict(red=0, green=0, blue=0)
-    [_, rounds] = game.split(":", maxsplit=1)
-    for round in rounds.split(";"):
-        for info in round.split(","):
-            [count, color] = info.strip().split(maxsplit=1)
-            maxs[color] = max(maxs[color], int(count))
+def solve(data: bytes) -> int:
+    return Games.parse(data).power_sum()
 
-    return math.prod(maxs.values())
 
-
-def solve(reader: io.TextIOBase) -> int:
-    return sum(analyse_game(line) for line in reader)
-
-
-assert solve(io.StringIO(EXAMPLE_INPUT)) == EXAMPLE_OUTPUT
+@selftest.register
+def test_example() -> None:
+    assert solve(EXAMPLE_INPUT.encode()) == EXAMPLE_OUTPUT
 
 
 def main():
-    with open(f"input/day{DAY:02}.txt") as file:
-        solution = solve(file)
+    with rawinput.load(f"input/day{DAY:02}.txt") as data:
+        solution = solve(data)
         print(solution)
 
 
 if __name__ == "__main__":
+    selftest.run(__name__)
     main()
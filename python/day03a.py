@@ -1,6 +1,12 @@
 import io
+import os
+import schematic
+from schematic import Schematic
+import selftest
 
 DAY = 3
+# Inputs larger than this are streamed rather than indexed.
+STREAM_BYTES = 2**26
 EXAMPLE_INPUT = """467..114..
 ...*......
 ..35..633.
@@ -14,43 +20,25 @@ EXAMPLE_INPUT = """467..114..
 EXAMPLE_OUTPUT = 4361
 
 
-def is_symbol(c: str) -> bool:
-    return not c.isdigit() and c != "."
+def solve(reader: io.TextIOBase, streaming: bool = False) -> int:
+    if streaming:
+        return sum(row[0] for row in schematic.stream(reader))
+    return sum(Schematic.parse(reader).part_numbers())
 
-def solve(reader: io.TextIOBase) -> int:
-    schematic = [line.strip() for line in reader]
-    height = len(schematic)
-    width = len(schematic[0])
-    result = 0
 
-    for row in range(height):
-        col = 0
-        while col < width:
-            if not schematic[row][col].isdigit():
-                col += 1
-                continue
-            start_col = col
-            while col < width and schematic[row][col].isdigit():
-                col += 1
-            is_relevant = any(
-                is_symbol(schematic[r][c])
-                for r in range(row-1, row+2) if 0 <= r < height
-                for c in range(start_col-1, col+1) if 0 <= c < width
-            )
-            if is_relevant:
-                result += int(schematic[row][start_col:col])
-
-    return result
-
-
-assert solve(io.StringIO(EXAMPLE_INPUT)) == EXAMPLE_OUTPUT
+@selftest.register
+def test_example() -> None:
+    assert solve(io.StringIO(EXAMPLE_INPUT)) == EXAMPLE_OUTPUT
+    assert solve(io.StringIO(EXAMPLE_INPUT), streaming=True) == EXAMPLE_OUTPUT
 
 
 def main():
-    with open(f"input/day{DAY:02}.txt") as file:
-        solution = solve(file)
+    path = f"input/day{DAY:02}.txt"
+    with open(path) as file:
+        solution = solve(file, streaming=os.path.getsize(path) > STREAM_BYTES)
         print(solution)
 
 
 if __name__ == "__main__":
+    selftest.run(__name__)
     main()
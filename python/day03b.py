@@ -1,7 +1,13 @@
 import io
+import os
 import math
+import schematic
+from schematic import Schematic
+import selftest
 
 DAY = 3
+# Inputs larger than this are streamed rather than indexed.
+STREAM_BYTES = 2**26
 EXAMPLE_INPUT = """467..114..
 ...*......
 ..35..633.
@@ -15,57 +21,31 @@ EXAMPLE_INPUT = """467..114..
 EXAMPLE_OUTPUT = 467835
 
 
-def solve(reader: io.TextIOBase) -> int:
-    schematic = [line.strip() for line in reader]
-    height = len(schematic)
-    width = len(schematic[0])
+def solve(reader: io.TextIOBase, streaming: bool = False) -> int:
+    if streaming:
+        return sum(row[1] for row in schematic.stream(reader))
+    return sum(math.prod(parts) for parts in Schematic.parse(reader).gears(2))
 
-    def extract_num(line: str, i: int) -> int:
-        n = len(line)
-        start = next(
-            filter(lambda j: j <= 0 or not line[j - 1].isdigit(), range(i, -1, -1))
-        )
-        end = next(
-            filter(lambda j: j >= n or not line[j].isdigit(), range(i + 1, n + 1))
-        )
-        return int(line[start:end])
 
-    result = 0
+@selftest.register
+def test_example() -> None:
+    assert solve(io.StringIO(EXAMPLE_INPUT)) == EXAMPLE_OUTPUT
+    assert solve(io.StringIO(EXAMPLE_INPUT), streaming=True) == EXAMPLE_OUTPUT
 
-    for row in range(height):
-        for col in range(width):
-            if schematic[row][col] != "*":
-                continue
 
-            anchors = []
-            for r in (row - 1, row, row + 1):
-                if not (0 <= r < height):
-                    continue
-                if schematic[r][col].isdigit():
-                    anchors.append((r, col))
-                else:
-                    for c in (col - 1, col + 1):
-                        if not (0 <= c < height):
-                            continue
-                        if schematic[r][c].isdigit():
-                            anchors.append((r, c))
-
-            if len(anchors) == 2:
-                result += math.prod(
-                    extract_num(schematic[row], col) for (row, col) in anchors
-                )
-
-    return result
-
-
-assert solve(io.StringIO(EXAMPLE_INPUT)) == EXAMPLE_OUTPUT
+@selftest.register
+def test_gears_with_one_part() -> None:
+    schematic = Schematic.parse(io.StringIO(EXAMPLE_INPUT))
+    assert list(schematic.gears(1)) == [[617]]
 
 
 def main():
-    with open(f"input/day{DAY:02}.txt") as file:
-        solution = solve(file)
+    path = f"input/day{DAY:02}.txt"
+    with open(path) as file:
+        solution = solve(file, streaming=os.path.getsize(path) > STREAM_BYTES)
         print(solution)
 
 
 if __name__ == "__main__":
+    selftest.run(__name__)
     main()
@@ -1,4 +1,5 @@
-import io
+import rawinput
+import selftest
 
 DAY = 4
 EXAMPLE_INPUT = """Card 1: 41 48 83 86 17 | 83 86  6 31 17  9 48 53
@@ -10,11 +11,11 @@ Card 6: 31 18 13 56 72 | 74 77 10 23 35 67 36 11"""
 EXAMPLE_OUTPUT = 13
 
 
-def solve(reader: io.TextIOBase) -> int:
+def solve(data: bytes) -> int:
     result = 0
-    for line in reader:
-        (_, _, *nums) = line.split()
-        bar = nums.index("|")
+    for line in rawinput.lines(data):
+        (_, _, *nums) = rawinput.fields(line)
+        bar = nums.index(b"|")
         winning = set(nums[:bar])
         actual = set(nums[bar + 1 :])
         count = len(winning & actual)
@@ -23,14 +24,17 @@ def solve(reader: io.TextIOBase) -> int:
     return result
 
 
-assert solve(io.StringIO(EXAMPLE_INPUT)) == EXAMPLE_OUTPUT
+@selftest.register
+def test_example() -> None:
+    assert solve(EXAMPLE_INPUT.encode()) == EXAMPLE_OUTPUT
 
 
 def main():
-    with open(f"input/day{DAY:02}.txt") as file:
-        solution = solve(file)
+    with rawinput.load(f"input/day{DAY:02}.txt") as data:
+        solution = solve(data)
         print(solution)
 
 
 if __name__ == "__main__":
+    selftest.run(__name__)
     main()
@@ -1,4 +1,6 @@
-import io
+import numpy as np
+import rawinput
+import selftest
 
 DAY = 4
 EXAMPLE_INPUT = """Card 1: 41 48 83 86 17 | 83 86  6 31 17  9 48 53
@@ -10,28 +12,77 @@ Card 6: 31 18 13 56 72 | 74 77 10 23 35 67 36 11"""
 EXAMPLE_OUTPUT = 30
 
 
-def solve(reader: io.TextIOBase) -> int:
-    lines = list(reader)
-    copies = [1 for _ in lines]
-    for i, line in enumerate(lines):
-        (_, _, *nums) = line.split()
-        bar = nums.index("|")
-        winning = set(nums[:bar])
-        actual = set(nums[bar + 1 :])
-        count = len(winning & actual)
-        for j in range(i + 1, i + count + 1):
-            copies[j] += copies[i]
-    return sum(copies)
+def matches(data: bytes) -> np.ndarray:
+    # Works on the whole file at once: finds every number, tells the card ids,
+    # winning numbers and numbers you have apart by the colons and bars around
+    # them, and sets their bits in two masks per card, with as many 64-bit words
+    # as the largest number needs. The matches are then the bits the masks have
+    # in common, counted with np.bitwise_count, which needs NumPy 2.
+    chars = np.frombuffer(data, dtype=np.uint8)
+    digits = chars - np.uint8(ord("0"))
+    edges = np.diff((digits < 10).view(np.int8), prepend=0, append=0)
+    starts = np.flatnonzero(edges == 1)
+    lengths = np.flatnonzero(edges == -1) - starts
+    colons = np.flatnonzero(chars == ord(":"))
+    bars = np.flatnonzero(chars == ord("|"))
+    card = np.searchsorted(colons, starts) - 1
+    # A card's id is the last number before its colon.
+    numbers = np.ones(len(starts), dtype=bool)
+    numbers[np.searchsorted(starts, colons) - 1] = False
+    (starts, lengths, card) = (starts[numbers], lengths[numbers], card[numbers])
+    values = np.zeros(len(starts), dtype=np.int64)
+    for i in range(lengths.max(initial=0)):
+        longer = lengths > i
+        values[longer] = 10 * values[longer] + digits[starts[longer] + i]
+    have = (starts > bars[card]).view(np.int8)
+    words = values.max(initial=0) // 64 + 1
+    masks = np.zeros((2, len(colons), words), dtype=np.uint64)
+    bits = np.left_shift(np.uint64(1), (values & 63).astype(np.uint64))
+    np.bitwise_or.at(masks, (have, card, values >> 6), bits)
+    return np.bitwise_count(masks[0] & masks[1]).sum(axis=1)
 
 
-assert solve(io.StringIO(EXAMPLE_INPUT)) == EXAMPLE_OUTPUT
+def solve(data: bytes) -> int:
+    # Each card adds its copies to a run of the next cards, which the difference
+    # array records by its two ends.
+    counts = matches(data).tolist()
+    delta = [0] * (len(counts) + 1)
+    result = 0
+    copies = 1
+    for i, count in enumerate(counts):
+        copies += delta[i]
+        result += copies
+        if count > 0:
+            delta[i + 1] += copies
+            delta[min(i + count + 1, len(counts))] -= copies
+    return result
+
+
+@selftest.register
+def test_example() -> None:
+    assert solve(EXAMPLE_INPUT.encode()) == EXAMPLE_OUTPUT
+
+
+@selftest.register
+def test_long_streak() -> None:
+    # Every card wins the next five, the last ones past the end of the pile.
+    card = "Card 1: 1 2 3 4 5 | 1 2 3 4 5"
+    assert solve("\n".join([card] * 8).encode()) == 1 + 2 + 4 + 8 + 16 + 32 + 63 + 124
+
+
+@selftest.register
+def test_large_numbers() -> None:
+    cards = ["Card 1: 100 250 3 | 250 3 999", "Card 2: 64 128 | 1 2", "Card 3: 5 | 5"]
+    assert matches("\n".join(cards).encode()).tolist() == [2, 0, 1]
+    assert solve("\n".join(cards).encode()) == 1 + 2 + 2
 
 
 def main():
-    with open(f"input/day{DAY:02}.txt") as file:
-        solution = solve(file)
+    with rawinput.load(f"input/day{DAY:02}.txt") as data:
+        solution = solve(data)
         print(solution)
 
 
 if __name__ == "__main__":
+    selftest.run(__name__)
     main()
@@ -1,6 +1,8 @@
-from dataclasses import dataclass
 import io
 import os
+from almanac import IDENTITY, Almanac, Map
+import resultcache
+import selftest
 
 EXAMPLE_INPUT = """seeds: 79 14 55 13
 
@@ -38,43 +40,28 @@ humidity-to-location map:
 EXAMPLE_OUTPUT = 35
 
 
-class Map:
-    @dataclass
-    class Entry:
-        dest: int
-        source: int
-        length: int
-
-    entries: list[Entry]
-
-    def __init__(self, reader: io.TextIOBase):
-        self.entries = []
-        line = reader.readline().strip()
-        while line != "":
-            [dest, source, length] = [int(word) for word in line.split()]
-            self.entries.append(self.Entry(dest, source, length))
-            line = reader.readline().strip()
-
-    def __getitem__(self, source: int) -> int:
-        for entry in self.entries:
-            if entry.source <= source < entry.source + entry.length:
-                return entry.dest + source - entry.source
-        return source
+def solve(reader: io.TextIOBase) -> int:
+    almanac = resultcache.cached(Almanac.parse, reader.read())
+    return int(almanac.location(almanac.seeds).min())
 
 
-def solve(reader: io.TextIOBase) -> int:
-    line = reader.readline()
-    ids = [int(word) for word in line.split()[1:]]
-    reader.readline()
-    line = reader.readline().strip()
-    while line != "":
-        map = Map(reader)
-        ids = [map[id] for id in ids]
-        line = reader.readline().strip()
-    return min(ids)
+@selftest.register
+def test_example() -> None:
+    assert solve(io.StringIO(EXAMPLE_INPUT)) == EXAMPLE_OUTPUT
 
 
-assert solve(io.StringIO(EXAMPLE_INPUT)) == EXAMPLE_OUTPUT
+@selftest.register
+def test_compose() -> None:
+    blocks = [block.splitlines()[1:] for block in EXAMPLE_INPUT.split("\n\n")[1:]]
+    maps = [Map.parse(lines) for lines in blocks]
+    location = IDENTITY
+    for map in maps:
+        location = location.compose(map)
+    for id in range(120):
+        value = id
+        for map in maps:
+            value = map[value]
+        assert location[id] == value
 
 
 def main():
@@ -85,4 +72,5 @@ def main():
 
 
 if __name__ == "__main__":
+    selftest.run(__name__)
     main()
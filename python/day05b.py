@@ -1,6 +1,9 @@
-from dataclasses import dataclass
 import io
 import os
+import numpy as np
+from almanac import Almanac, condense
+import resultcache
+import selftest
 
 EXAMPLE_INPUT = """seeds: 79 14 55 13
 
@@ -38,95 +41,39 @@ humidity-to-location map:
 EXAMPLE_OUTPUT = 46
 
 
-@dataclass(order=True)
-class I:
-    start: int
-    end: int
-
-
-def condense(intervals: list[I]) -> list[I]:
-    if len(intervals) == 0:
-        return []
-    intervals.sort()
-    res = []
-    prev = intervals[0]
-    for curr in intervals[1:]:
-        if curr.start <= prev.end:
-            prev.end = max(prev.end, curr.end)
-        else:
-            res.append(prev)
-            prev = curr
-    res.append(prev)
-    return res
-
-
-assert condense([I(0, 3), I(1, 2), I(3, 5), I(6, 8), I(7, 9)]) == [I(0, 5), I(6, 9)]
-
-
-@dataclass(order=True)
-class E:
-    interval: I
-    delta: int
-
-
-def transform(intervals: list[I], entries: list[E]) -> list[I]:
-    res = []
-    m, n = len(intervals), len(entries)
-    i, j = 0, 0
-    while i < m and j < n:
-        interval, entry = intervals[i], entries[j]
-        if interval.start < entry.interval.start:
-            if interval.end <= entry.interval.start:
-                res.append(interval)
-                i += 1
-                continue
-            res.append(I(interval.start, entry.interval.start))
-            interval.start = entry.interval.start
-        delta = entry.delta
-        if interval.end <= entry.interval.end:
-            interval.start += delta
-            interval.end += delta
-            res.append(interval)
-            i += 1
-            continue
-        if interval.start < entry.interval.end:
-            res.append(I(interval.start + delta, entry.interval.end + delta))
-            interval.start = entry.interval.end
-        j += 1
-    res.extend(intervals[i:])
-    return res
-
-
 def solve(reader: io.TextIOBase) -> int:
-    intervals = []
-    line = reader.readline()
-    nums = [int(word) for word in line.split()[1:]]
-    for i in range(0, len(nums), 2):
-        start, length = nums[i], nums[i + 1]
-        intervals.append(I(start, start + length))
-    reader.readline()
+    almanac = resultcache.cached(Almanac.parse, reader.read())
+    (starts, lengths) = (almanac.seeds[0::2], almanac.seeds[1::2])
+    return almanac.lowest(starts, starts + lengths)
+
 
-    transformers = []
-    line = reader.readline().strip()
-    while line != "":
-        transformer = []
-        line = reader.readline().strip()
-        while line != "":
-            [dest, source, length] = [int(word) for word in line.split()]
-            transformer.append(E(I(source, source + length), dest - source))
-            line = reader.readline().strip()
-        transformer.sort()
-        transformers.append(transformer)
-        line = reader.readline().strip()
+@selftest.register
+def test_queries() -> None:
+    almanac = Almanac.parse(EXAMPLE_INPUT)
+    assert almanac.location(79) == 82
+    assert almanac.seeds_at(46) == [82]
+    assert almanac.lowest([79], [93]) == 46
+    assert almanac.lowest([55], [56]) == 86
+    try:
+        almanac.lowest([], [])
+        assert False, "no seeds must raise"
+    except ValueError:
+        pass
 
-    intervals = condense(intervals)
-    for transformer in transformers:
-        intervals = condense(transform(intervals, transformer))
 
-    return intervals[0].start
+@selftest.register
+def test_example() -> None:
+    assert solve(io.StringIO(EXAMPLE_INPUT)) == EXAMPLE_OUTPUT
 
 
-assert solve(io.StringIO(EXAMPLE_INPUT)) == EXAMPLE_OUTPUT
+@selftest.register
+def test_condense() -> None:
+    starts = np.array([0, 1, 3, 6, 7])
+    ends = np.array([3, 2, 5, 8, 9])
+    (starts, ends) = condense(starts, ends)
+    assert starts.tolist() == [0, 6] and ends.tolist() == [5, 9]
+    (starts, ends) = condense(starts[:0], ends[:0])
+    assert len(starts) == len(ends) == 0
 
 
 def main():
@@ -137,4 +84,5 @@ def main():
 
 
 if __name__ == "__main__":
+    selftest.run(__name__)
     main()
@@ -1,23 +1,23 @@
 import io
 import math
 import os
+from races import ways_batch
+import selftest
 
 EXAMPLE_INPUT = """Time:      7  15   30
 Distance:  9  40  200"""
 EXAMPLE_OUTPUT = 288
 
 
-def ways(time: int, dist: int) -> int:
-    return sum(1 for hold in range(0, time+1) if hold * (time - hold) > dist)
-
-
 def solve(reader: io.TextIOBase) -> int:
-    times = reader.readline().split()[1:]
-    dists = reader.readline().split()[1:]
-    return math.prod(ways(int(time), int(dist)) for (time, dist) in zip(times, dists))
+    times = [int(word) for word in reader.readline().split()[1:]]
+    dists = [int(word) for word in reader.readline().split()[1:]]
+    return math.prod(ways_batch(times, dists).tolist())
 
 
-assert solve(io.StringIO(EXAMPLE_INPUT)) == EXAMPLE_OUTPUT
+@selftest.register
+def test_example() -> None:
+    assert solve(io.StringIO(EXAMPLE_INPUT)) == EXAMPLE_OUTPUT
 
 
 def main():
@@ -28,4 +28,5 @@ def main():
 
 
 if __name__ == "__main__":
+    selftest.run(__name__)
     main()
@@ -1,24 +1,31 @@
 import io
-import math
 import os
+from races import ways
+import selftest
 
 EXAMPLE_INPUT = """Time:      7  15   30
 Distance:  9  40  200"""
 EXAMPLE_OUTPUT = 71503
 
 
-def ways(time: int, dist: int) -> int:
-    disc = math.sqrt(time * time / 4 - dist)
-    return math.floor(time / 2 + disc) - math.ceil(time / 2 - disc) + 1
-
-
 def solve(reader: io.TextIOBase) -> int:
     time = int("".join(reader.readline().split()[1:]))
     dist = int("".join(reader.readline().split()[1:]))
     return ways(time, dist)
 
 
-assert solve(io.StringIO(EXAMPLE_INPUT)) == EXAMPLE_OUTPUT
+@selftest.register
+def test_example() -> None:
+    assert solve(io.StringIO(EXAMPLE_INPUT)) == EXAMPLE_OUTPUT
+
+
+@selftest.register
+def test_beyond_floats() -> None:
+    # Holding for 10**20 ms exactly ties the record, which a float square root
+    # of the discriminant cannot tell apart from winning.
+    time = 2 * 10**20
+    assert ways(time, 10**40) == 0
+    assert ways(time, 10**40 - 1) == 1
 
 
 def main():
@@ -29,4 +36,5 @@ def main():
 
 
 if __name__ == "__main__":
+    selftest.run(__name__)
     main()
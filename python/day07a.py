@@ -1,6 +1,7 @@
-from collections import Counter
-import io
 import os
+import camelcards
+import rawinput
+import selftest
 
 EXAMPLE_INPUT = """32T3K 765
 T55J5 684
@@ -9,39 +10,23 @@ KTJJT 220
 QQQJA 483"""
 EXAMPLE_OUTPUT = 6440
 
-CARD_VALUES = dict(zip("23456789TJQKA", range(2, 15)))
 
-HAND_VALUES = {
-    (1, 1, 1, 1, 1): 1,
-    (2, 1, 1, 1): 2,
-    (2, 2, 1): 3,
-    (3, 1, 1): 4,
-    (3, 2): 5,
-    (4, 1): 6,
-    (5,): 7,
-}
+def solve(data: bytes) -> int:
+    return camelcards.winnings(data)
 
 
-def hand_value(hand: str) -> tuple[int, ...]:
-    sig = tuple(sorted(Counter(hand).values(), reverse=True))
-    return (HAND_VALUES[sig],) + tuple(CARD_VALUES[card] for card in hand)
-
-
-def solve(reader: io.TextIOBase) -> int:
-    hands = [line.split() for line in reader]
-    hands.sort(key=lambda hand_bet: hand_value(hand_bet[0]))
-    return sum((i + 1) * int(bet) for (i, (_, bet)) in enumerate(hands))
-
-
-assert solve(io.StringIO(EXAMPLE_INPUT)) == EXAMPLE_OUTPUT
+@selftest.register
+def test_example() -> None:
+    assert solve(EXAMPLE_INPUT.encode()) == EXAMPLE_OUTPUT
 
 
 def main():
     prefix = os.path.splitext(os.path.basename(__file__))[0][:-1]
-    with open(f"input/{prefix}.txt") as file:
-        solution = solve(file)
+    with rawinput.load(f"input/{prefix}.txt") as data:
+        solution = solve(data)
         print(solution)
 
 
 if __name__ == "__main__":
+    selftest.run(__name__)
     main()
@@ -1,6 +1,8 @@
 import io
-import itertools
 import os
+import resultcache
+from wasteland import Network
+import selftest
 
 EXAMPLE_INPUT = """RL
 
@@ -15,19 +17,14 @@ EXAMPLE_OUTPUT = 2
 
 
 def solve(reader: io.TextIOBase) -> int:
-    dirs = itertools.cycle(next(reader).strip())
-    next(reader)
-    network = {line[0:3]: {"L": line[7:10], "R": line[12:15]} for line in reader}
-    count = 0
-    loc = "AAA"
-    while loc != "ZZZ":
-        dir = next(dirs)
-        loc = network[loc][dir]
-        count += 1
-    return count
+    network = resultcache.cached(Network.parse, reader.read())
+    target = network.ids["ZZZ"]
+    return next(count for (count, id) in network.walk("AAA") if id == target)
 
 
-assert solve(io.StringIO(EXAMPLE_INPUT)) == EXAMPLE_OUTPUT
+@selftest.register
+def test_example() -> None:
+    assert solve(io.StringIO(EXAMPLE_INPUT)) == EXAMPLE_OUTPUT
 
 
 def main():
@@ -38,4 +35,5 @@ def main():
 
 
 if __name__ == "__main__":
+    selftest.run(__name__)
     main()
@@ -2,9 +2,11 @@ from __future__ import annotations
 from dataclasses import dataclass
 import functools
 import io
-import itertools
 import math
 import os
+import resultcache
+from wasteland import Network
+import selftest
 
 EXAMPLE_INPUT = """LR
 
@@ -27,10 +29,12 @@ def egcd(a: int, b: int) -> tuple[int, int, int]:
     return (a, s, t)
 
 
-for a in range(1, 100):
-    for b in range(1, 100):
-        (d, s, t) = egcd(a, b)
-        assert d == math.gcd(a, b) and d == s * a + t * b
+@selftest.register
+def test_egcd() -> None:
+    for a in range(1, 100):
+        for b in range(1, 100):
+            (d, s, t) = egcd(a, b)
+            assert d == math.gcd(a, b) and d == s * a + t * b
 
 
 @dataclass(frozen=True)
@@ -48,34 +52,32 @@ class Loop:
         return Loop(start, length)
 
 
-assert Loop(1, 1).combine(Loop(2, 5)) == Loop(2, 5)
-assert Loop(2, 5).combine(Loop(4, 7)) == Loop(32, 35)
+@selftest.register
+def test_loop_combine() -> None:
+    assert Loop(1, 1).combine(Loop(2, 5)) == Loop(2, 5)
+    assert Loop(2, 5).combine(Loop(4, 7)) == Loop(32, 35)
 
 
-def loop_shape(dirs: str, network: dict[str, dict[str, str]], loc: str) -> Loop:
-    dirs_it = itertools.cycle(dirs)
-    seen: dict[str, int] = {}
-    count = 0
-    while loc not in seen:
-        if loc.endswith("Z"):
-            seen[loc] = count
-        loc = network[loc][next(dirs_it)]
-        count += 1
-    start = seen[loc]
-    return Loop(start, count - start)
+def loop_shape(network: Network, loc: str) -> Loop:
+    seen: dict[int, int] = {}
+    for count, id in network.walk(loc):
+        if id in seen:
+            return Loop(seen[id], count - seen[id])
+        seen[id] = count
+    raise Exception("walk ended")
 
 
 def solve(reader: io.TextIOBase) -> int:
-    dirs = next(reader).strip()
-    next(reader)
-    network = {line[0:3]: {"L": line[7:10], "R": line[12:15]} for line in reader}
-    locs = [loc for loc in network if loc.endswith("A")]
-    shapes = [loop_shape(dirs, network, loc) for loc in locs]
+    network = resultcache.cached(Network.parse, reader.read())
+    locs = [loc for loc in network.names if loc.endswith("A")]
+    shapes = [loop_shape(network, loc) for loc in locs]
     shape = functools.reduce(Loop.combine, shapes, Loop(1, 1))
     return shape.start
 
 
-assert solve(io.StringIO(EXAMPLE_INPUT)) == EXAMPLE_OUTPUT
+@selftest.register
+def test_example() -> None:
+    assert solve(io.StringIO(EXAMPLE_INPUT)) == EXAMPLE_OUTPUT
 
 
 def main():
@@ -86,4 +88,5 @@ def main():
 
 
 if __name__ == "__main__":
+    selftest.run(__name__)
     main()
@@ -1,6 +1,8 @@
-import io
 import itertools
 import os
+from profiling import phase
+import rawinput
+import selftest
 
 EXAMPLE_INPUT = """0 3 6 9 12 15
 1 3 6 10 15 21
@@ -18,19 +20,24 @@ def next_number(numbers: list[int]) -> int:
     return result
 
 
-def solve(reader: io.TextIOBase) -> int:
-    return sum(next_number([int(n) for n in line.split()]) for line in reader)
+def solve(data: bytes) -> int:
+    with phase("parse"):
+        histories = [rawinput.ints(line) for line in rawinput.lines(data)]
+    return sum(next_number(history) for history in histories)
 
 
-assert solve(io.StringIO(EXAMPLE_INPUT)) == EXAMPLE_OUTPUT
+@selftest.register
+def test_example() -> None:
+    assert solve(EXAMPLE_INPUT.encode()) == EXAMPLE_OUTPUT
 
 
 def main():
     prefix = os.path.splitext(os.path.basename(__file__))[0][:-1]
-    with open(f"input/{prefix}.txt") as file:
-        solution = solve(file)
+    with rawinput.load(f"input/{prefix}.txt") as data:
+        solution = solve(data)
         print(solution)
 
 
 if __name__ == "__main__":
+    selftest.run(__name__)
     main()
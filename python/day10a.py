@@ -1,7 +1,8 @@
 from __future__ import annotations
-from enum import Enum
 import io
 import os
+from grid import DOWN, LEFT, RIGHT, UP, Grid
+import selftest
 
 EXAMPLE_INPUT = """7-F7-
 .FJ|7
@@ -10,55 +11,34 @@ SJLL7
 LJ.LJ"""
 EXAMPLE_OUTPUT = 8
 
-Point = tuple[int, int]
-
-class Dir(Enum):
-    NORTH = (-1, 0)
-    EAST = (0, 1)
-    SOUTH = (1, 0)
-    WEST = (0, -1)
-
-    def flip(self) -> Dir:
-        return Dir((-self.value[0], -self.value[1]))
-
-    def move(self, p: Point) -> Point:
-        return (p[0] + self.value[0], p[1] + self.value[1])
-
+# The directions each pipe connects, turned into offsets once the grid is known.
 PIPES = {
-    "|": (Dir.NORTH, Dir.SOUTH),
-    "-": (Dir.EAST, Dir.WEST),
-    "L": (Dir.NORTH, Dir.EAST),
-    "J": (Dir.NORTH, Dir.WEST),
-    "7": (Dir.SOUTH, Dir.WEST),
-    "F": (Dir.SOUTH, Dir.EAST),
+    "|": (UP, DOWN),
+    "-": (RIGHT, LEFT),
+    "L": (UP, RIGHT),
+    "J": (UP, LEFT),
+    "7": (DOWN, LEFT),
+    "F": (DOWN, RIGHT),
 }
 
 
-def at(map: list[str], p) -> str:
-    return map[p[0]][p[1]]
-
-
 def solve(reader: io.TextIOBase) -> int:
-    map = list(reader)
-    start = (-1, -1)
-    for i, row in enumerate(map):
-        j = row.find("S")
-        if j >= 0:
-            start = (i, j)
-            break
-    prev, curr = start, (-1, -1)
-    for dir in Dir:
-        curr = dir.move(prev)
-        char = at(map, curr)
-        if char not in PIPES:
-            continue
-        if dir.flip() in PIPES[char]:
+    map = Grid.parse(reader, border=".")
+    offsets = map.offsets()
+    pipes = {
+        ord(char): tuple(offsets[dir] for dir in dirs) for char, dirs in PIPES.items()
+    }
+    start = map.find("S")
+    prev, curr = start, -1
+    for offset in offsets:
+        curr = start + offset
+        if -offset in pipes.get(map.cells[curr], ()):
             break
     count = 1
     while curr != start:
-        next = (-1, -1)
-        for dir in PIPES[at(map, curr)]:
-            next = dir.move(curr)
+        next = -1
+        for offset in pipes[map.cells[curr]]:
+            next = curr + offset
             if next != prev:
                 break
         prev, curr = curr, next
@@ -67,7 +47,9 @@ def solve(reader: io.TextIOBase) -> int:
     return count // 2
 
 
-assert solve(io.StringIO(EXAMPLE_INPUT)) == EXAMPLE_OUTPUT
+@selftest.register
+def test_example() -> None:
+    assert solve(io.StringIO(EXAMPLE_INPUT)) == EXAMPLE_OUTPUT
 
 
 def main():
@@ -78,4 +60,5 @@ def main():
 
 
 if __name__ == "__main__":
+    selftest.run(__name__)
     main()
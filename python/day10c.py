@@ -1,9 +1,10 @@
 from __future__ import annotations
-from dataclasses import dataclass
-from enum import Enum
 import io
 import os
 from typing import Callable
+from grid import Grid
+from profiling import phase
+import selftest
 
 EXAMPLE_INPUT = """7-F7-
 .FJ|7
@@ -13,60 +14,21 @@ LJ.LJ"""
 EXAMPLE_OUTPUT = 8
 
 
-class Dir(Enum):
-    NORTH = (-1, 0)
-    EAST = (0, 1)
-    SOUTH = (1, 0)
-    WEST = (0, -1)
+OUTSIDE = 2
 
 
-@dataclass(frozen=True)
-class Point:
-    row: int
-    col: int
-
-    def __add__(self, other: Point | Dir) -> Point:
-        if isinstance(other, Point):
-            return Point(self.row + other.row, self.col + other.col)
-        if isinstance(other, Dir):
-            return Point(self.row + other.value[0], self.col + other.value[1])
-        raise TypeError(f"Cannot add Point + {type(other)}")
-
-    def __rmul__(self, s: int) -> Point:
-        return Point(s * self.row, s * self.col)
-
-
-@dataclass
-class Map:
-    data: list[list[int]]
-
-    @staticmethod
-    def sized(m: int, n: int) -> Map:
-        return Map([[0 for _ in range(n)] for _ in range(m)])
-
-    def __contains__(self, p: Point) -> bool:
-        return 0 <= p.row < len(self.data) and 0 <= p.col < len(self.data[p.row])
-
-    def __getitem__(self, p: Point) -> int:
-        return self.data[p.row][p.col]
-
-    def __setitem__(self, p: Point, value: int):
-        self.data[p.row][p.col] = value
-
-    def __str__(self) -> str:
-        return "\n".join("".join(map(str, row)) for row in self.data)
-
-    def search(self, start: Point, pred: Callable[[Point, int], bool]) -> set[Point]:
-        queue = [start]
-        visited = set([start])
-        while len(queue) > 0:
-            p = queue.pop()
-            for dir in Dir:
-                q = p + dir
-                if q in self and pred(q, self[q]) and q not in visited:
-                    queue.append(q)
-                    visited.add(q)
-        return visited
+def search(map: Grid, start: int, pred: Callable[[int, int], bool]) -> set[int]:
+    offsets = map.offsets()
+    queue = [start]
+    visited = set([start])
+    while len(queue) > 0:
+        p = queue.pop()
+        for offset in offsets:
+            q = p + offset
+            if q not in visited and pred(q, map.cells[q]):
+                queue.append(q)
+                visited.add(q)
+    return visited
 
 
 ZOOMED = {
@@ -81,33 +43,38 @@ ZOOMED = {
 }
 
 
-def zoom(input: list[str]) -> tuple[Map, Point]:
+def zoom(input: list[str]) -> tuple[Grid, int]:
     m, n = len(input), len(input[0])
-    start = Point(-1, -1)
-    map = Map.sized(3 * m, 3 * n)
+    start = -1
+    map = Grid.filled(3 * m, 3 * n, border=OUTSIDE)
     for i in range(m):
         for j in range(n):
             cell = input[i][j]
-            point = 3 * Point(i, j)
             if cell == "S":
-                start = point + Point(1, 1)
+                start = map.index(3 * i + 1, 3 * j + 1)
             zoomed = ZOOMED[cell]
             for di in range(3):
-                for dj in range(3):
-                    map[point + Point(di, dj)] = zoomed[di][dj]
-    for dir in Dir:
-        if start + dir + dir in map and map[start + dir + dir] == 1:
-            map[start + dir] = 1
+                row = map.index(3 * i + di, 3 * j)
+                map.cells[row : row + 3] = bytes(zoomed[di])
+    for offset in map.offsets():
+        if map.cells[start + 2 * offset] == 1:
+            map.cells[start + offset] = 1
     return (map, start)
 
 
 def solve(reader: io.TextIOBase) -> int:
-    (map, start) = zoom([line.strip() for line in reader])
-    path = map.search(start, lambda _, pixel: pixel == 1)
+    with phase("parse"):
+        input = [line.strip() for line in reader]
+    with phase("zoom"):
+        (map, start) = zoom(input)
+    with phase("search"):
+        path = search(map, start, lambda _, pixel: pixel == 1)
     return len(path) // 6
 
 
-assert solve(io.StringIO(EXAMPLE_INPUT)) == EXAMPLE_OUTPUT
+@selftest.register
+def test_example() -> None:
+    assert solve(io.StringIO(EXAMPLE_INPUT)) == EXAMPLE_OUTPUT
 
 
 def main():
@@ -118,4 +85,5 @@ def main():
 
 
 if __name__ == "__main__":
+    selftest.run(__name__)
     main()
@@ -1,5 +1,6 @@
 import io
 import os
+import selftest
 
 EXAMPLE_INPUT = """...#......
 .......#..
@@ -13,6 +14,7 @@ EXAMPLE_INPUT = """...#......
 #...#....."""
 EXAMPLE_OUTPUT_10 = 1030
 EXAMPLE_OUTPUT_100 = 8410
+EXPANSION = 1_000_000
 
 
 def solve(reader: io.TextIOBase, expansion: int) -> int:
@@ -58,16 +60,19 @@ def solve(reader: io.TextIOBase, expansion: int) -> int:
     return result
 
 
-assert solve(io.StringIO(EXAMPLE_INPUT), 10) == EXAMPLE_OUTPUT_10
-assert solve(io.StringIO(EXAMPLE_INPUT), 100) == EXAMPLE_OUTPUT_100
+@selftest.register
+def test_example() -> None:
+    assert solve(io.StringIO(EXAMPLE_INPUT), 10) == EXAMPLE_OUTPUT_10
+    assert solve(io.StringIO(EXAMPLE_INPUT), 100) == EXAMPLE_OUTPUT_100
 
 
 def main():
     prefix = os.path.splitext(os.path.basename(__file__))[0][:-1]
     with open(f"input/{prefix}.txt") as file:
-        solution = solve(file, 1_000_000)
+        solution = solve(file, EXPANSION)
         print(solution)
 
 
 if __name__ == "__main__":
+    selftest.run(__name__)
     main()
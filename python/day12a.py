@@ -1,5 +1,6 @@
 import io
 import os
+import selftest
 
 EXAMPLE_INPUT = """???.### 1,1,3
 .??..??...?##. 1,1,3
@@ -52,7 +53,9 @@ def solve(reader: io.TextIOBase) -> int:
     return result
 
 
-assert solve(io.StringIO(EXAMPLE_INPUT)) == EXAMPLE_OUTPUT
+@selftest.register
+def test_example() -> None:
+    assert solve(io.StringIO(EXAMPLE_INPUT)) == EXAMPLE_OUTPUT
 
 
 def main():
@@ -63,4 +66,5 @@ def main():
 
 
 if __name__ == "__main__":
+    selftest.run(__name__)
     main()
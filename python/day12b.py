@@ -1,6 +1,8 @@
 from functools import cache
 import io
 import os
+from profiling import count
+import selftest
 
 EXAMPLE_INPUT = """???.### 1,1,3
 .??..??...?##. 1,1,3
@@ -46,6 +48,7 @@ def possibilities(s: str, t: tuple[int, ...]) -> int:
 
 
 def solve(reader: io.TextIOBase) -> int:
+    before = possibilities.cache_info()
     result = 0
     for line in reader:
         [s, t0] = line.split()
@@ -53,10 +56,15 @@ def solve(reader: io.TextIOBase) -> int:
         s = "?".join([s for _ in range(5)])
         t = sum([t for _ in range(5)], ())
         result += possibilities(s, t)
+    after = possibilities.cache_info()
+    count("cache hits", after.hits - before.hits)
+    count("cache misses", after.misses - before.misses)
     return result
 
 
-assert solve(io.StringIO(EXAMPLE_INPUT)) == EXAMPLE_OUTPUT
+@selftest.register
+def test_example() -> None:
+    assert solve(io.StringIO(EXAMPLE_INPUT)) == EXAMPLE_OUTPUT
 
 
 def main():
@@ -67,4 +75,5 @@ def main():
 
 
 if __name__ == "__main__":
+    selftest.run(__name__)
     main()
@@ -1,5 +1,6 @@
 import io
 import os
+import selftest
 
 EXAMPLE_INPUT = """#.##..##.
 ..#.##.#.
@@ -51,7 +52,9 @@ def solve(reader: io.TextIOBase) -> int:
     return result
 
 
-assert solve(io.StringIO(EXAMPLE_INPUT)) == EXAMPLE_OUTPUT
+@selftest.register
+def test_example() -> None:
+    assert solve(io.StringIO(EXAMPLE_INPUT)) == EXAMPLE_OUTPUT
 
 
 def main():
@@ -62,4 +65,5 @@ def main():
 
 
 if __name__ == "__main__":
+    selftest.run(__name__)
     main()
@@ -3,6 +3,7 @@ from __future__ import annotations
 import io
 import os
 from typing import Literal
+import selftest
 
 EXAMPLE_INPUT = """O....#....
 O.OO#....#
@@ -72,16 +73,18 @@ class Matrix[T]:
         self._rota = (self._rota + 1) % 4
 
 
-m = Matrix([[1, 2], [3, 4]])
-assert m.data == [[1, 2], [3, 4]]
-m.rotate_cw()
-assert m.data == [[3, 1], [4, 2]]
-m.rotate_cw()
-assert m.data == [[4, 3], [2, 1]]
-m.rotate_cw()
-assert m.data == [[2, 4], [1, 3]]
-m.rotate_cw()
-assert m.data == [[1, 2], [3, 4]]
+@selftest.register
+def test_matrix_rotation() -> None:
+    m = Matrix([[1, 2], [3, 4]])
+    assert m.data == [[1, 2], [3, 4]]
+    m.rotate_cw()
+    assert m.data == [[3, 1], [4, 2]]
+    m.rotate_cw()
+    assert m.data == [[4, 3], [2, 1]]
+    m.rotate_cw()
+    assert m.data == [[2, 4], [1, 3]]
+    m.rotate_cw()
+    assert m.data == [[1, 2], [3, 4]]
 
 
 def tilt(m: Matrix[str]) -> None:
@@ -137,7 +140,9 @@ def solve(reader: io.TextIOBase) -> int:
     return load(m1)
 
 
-assert solve(io.StringIO(EXAMPLE_INPUT)) == EXAMPLE_OUTPUT
+@selftest.register
+def test_example() -> None:
+    assert solve(io.StringIO(EXAMPLE_INPUT)) == EXAMPLE_OUTPUT
 
 
 def main():
@@ -148,4 +153,5 @@ def main():
 
 
 if __name__ == "__main__":
+    selftest.run(__name__)
     main()
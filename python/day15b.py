@@ -1,5 +1,6 @@
 import os
 from collections.abc import Callable
+import selftest
 
 EXAMPLE_INPUT = """rn=1,cm-,qp=3,cm=2,qp-,pc=4,ot=9,ab=5,pc-,pc=6,ot=7"""
 EXAMPLE_OUTPUT = 145
@@ -12,7 +13,9 @@ def hash(input: str) -> int:
     return res
 
 
-assert hash("HASH") == 52
+@selftest.register
+def test_hash() -> None:
+    assert hash("HASH") == 52
 
 
 def find[T](l: list[T], p: Callable[[T], bool]) -> int | None:
@@ -47,7 +50,9 @@ def solve(input: str) -> int:
     return result
 
 
-assert solve(EXAMPLE_INPUT) == EXAMPLE_OUTPUT
+@selftest.register
+def test_example() -> None:
+    assert solve(EXAMPLE_INPUT) == EXAMPLE_OUTPUT
 
 
 def main():
@@ -58,4 +63,5 @@ def main():
 
 
 if __name__ == "__main__":
+    selftest.run(__name__)
     main()
@@ -1,9 +1,9 @@
 from __future__ import annotations
 import io
 import os
-from collections.abc import Callable
-from dataclasses import dataclass
-from enum import IntEnum
+from grid import DOWN, LEFT, RIGHT, UP, Grid
+from profiling import count, phase
+import selftest
 
 EXAMPLE_INPUT = r""".|...\....
 |.-.\.....
@@ -18,84 +18,55 @@ EXAMPLE_INPUT = r""".|...\....
 EXAMPLE_OUTPUT = 46
 
 
-def dfs[T](init: T, succs: Callable[[T], list[T]]) -> set[T]:
-    seen = {init}
-    stack = [init]
-    while stack:
-        node = stack.pop()
-        for succ in succs(node):
-            if succ not in seen:
-                seen.add(succ)
-                stack.append(succ)
-    return seen
-
-
-@dataclass(frozen=True)
-class Pos:
-    row: int
-    col: int
-
-    def __add__(self, other: Pos) -> Pos:
-        return Pos(self.row + other.row, self.col + other.col)
-
-
-class Map:
-    data: list[str]
-
-    def __init__(self, data: list[str]) -> None:
-        self.data = data
-
-    def __contains__(self, pos: Pos) -> bool:
-        return 0 <= pos.row < len(self.data) and 0 <= pos.col < len(self.data[pos.row])
-
-    def __getitem__(self, pos: Pos) -> str:
-        return self.data[pos.row][pos.col]
-
-
-DELTAS = (Pos(0, 1), Pos(-1, 0), Pos(0, -1), Pos(1, 0))
-
-
-class Dir(IntEnum):
-    RIGHT = 0
-    UP = 1
-    LEFT = 2
-    DOWN = 3
-
-    @property
-    def delta(self) -> Pos:
-        return DELTAS[self]
-
-
-@dataclass(frozen=True)
-class Beam:
-    pos: Pos
-    dir: Dir
-
-
 EFFECTS = {
-    ".": [[Dir.RIGHT], [Dir.UP], [Dir.LEFT], [Dir.DOWN]],
-    "/": [[Dir.UP], [Dir.RIGHT], [Dir.DOWN], [Dir.LEFT]],
-    "\\": [[Dir.DOWN], [Dir.LEFT], [Dir.UP], [Dir.RIGHT]],
-    "-": [[Dir.RIGHT], [Dir.RIGHT, Dir.LEFT], [Dir.LEFT], [Dir.RIGHT, Dir.LEFT]],
-    "|": [[Dir.UP, Dir.DOWN], [Dir.UP], [Dir.UP, Dir.DOWN], [Dir.DOWN]],
+    ".": [[RIGHT], [UP], [LEFT], [DOWN]],
+    "/": [[UP], [RIGHT], [DOWN], [LEFT]],
+    "\\": [[DOWN], [LEFT], [UP], [RIGHT]],
+    "-": [[RIGHT], [RIGHT, LEFT], [LEFT], [RIGHT, LEFT]],
+    "|": [[UP, DOWN], [UP], [UP, DOWN], [DOWN]],
 }
+OUTSIDE = " "
 
 
 def solve(reader: io.TextIOBase) -> int:
-    map = Map([line.rstrip() for line in reader])
-
-    def succs(beam: Beam) -> list[Beam]:
-        return [
-            next
-            for dir in EFFECTS[map[beam.pos]][beam.dir]
-            if (next := Beam(beam.pos + dir.delta, dir)).pos in map
+    with phase("parse"):
+        map = Grid.parse(reader, border=OUTSIDE)
+    offsets = map.offsets()
+    outside = ord(OUTSIDE)
+    # A beam is four times its cell's index plus its direction, so every effect
+    # of a cell turns into fixed deltas to add to the beam.
+    moves = {
+        ord(char): [
+            [4 * offsets[new] + new - dir for new in news]
+            for dir, news in enumerate(effects)
         ]
-
-    beams = dfs(Beam(Pos(0, 0), Dir.RIGHT), succs)
-    return len({beam.pos for beam in beams})
-
-
-assert solve(io.StringIO(EXAMPLE_INPUT)) == EXAMPLE_OUTPUT
+        for char, effects in EFFECTS.items()
+    }
+
+    with phase("search"):
+        # Only one beam is followed, so it walks the grid itself rather than a
+        # graph of every beam, which would take longer to build than to walk.
+        cells = map.cells
+        start = 4 * map.index(0, 0) + RIGHT
+        seen = bytearray(4 * len(cells))
+        seen[start] = 1
+        found = [start]
+        stack = [start]
+        while stack:
+            beam = stack.pop()
+            for delta in moves[cells[beam >> 2]][beam & 3]:
+                next = beam + delta
+                if not seen[next] and cells[next >> 2] != outside:
+                    seen[next] = 1
+                    found.append(next)
+                    stack.append(next)
+        count("expanded", len(found))
+    return len({beam >> 2 for beam in found})
+
+
+@selftest.register
+def test_example() -> None:
+    assert solve(io.StringIO(EXAMPLE_INPUT)) == EXAMPLE_OUTPUT
 
 
 def main():
@@ -106,4 +77,5 @@ def main():
 
 
 if __name__ == "__main__":
+    selftest.run(__name__)
     main()
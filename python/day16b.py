@@ -1,9 +1,10 @@
 from __future__ import annotations
 import io
 import os
-from collections.abc import Callable
-from dataclasses import dataclass
-from enum import IntEnum
+from graph import Graph, dfs
+from grid import DOWN, LEFT, RIGHT, UP, Grid
+from profiling import phase
+import selftest
 
 EXAMPLE_INPUT = r""".|...\....
 |.-.\.....
@@ -18,95 +19,59 @@ EXAMPLE_INPUT = r""".|...\....
 EXAMPLE_OUTPUT = 51
 
 
-def dfs[T](init: T, succs: Callable[[T], list[T]]) -> set[T]:
-    seen = {init}
-    stack = [init]
-    while stack:
-        node = stack.pop()
-        for succ in succs(node):
-            if succ not in seen:
-                seen.add(succ)
-                stack.append(succ)
-    return seen
-
-
-@dataclass(frozen=True)
-class Pos:
-    row: int
-    col: int
-
-    def __add__(self, other: Pos) -> Pos:
-        return Pos(self.row + other.row, self.col + other.col)
-
-
-class Map:
-    data: list[str]
-
-    def __init__(self, data: list[str]) -> None:
-        self.data = data
-
-    def dims(self) -> tuple[int, int]:
-        return (len(self.data), len(self.data[0]))
-
-    def __contains__(self, pos: Pos) -> bool:
-        return 0 <= pos.row < len(self.data) and 0 <= pos.col < len(self.data[pos.row])
-
-    def __getitem__(self, pos: Pos) -> str:
-        return self.data[pos.row][pos.col]
-
-
-DELTAS = (Pos(0, 1), Pos(-1, 0), Pos(0, -1), Pos(1, 0))
-
-
-class Dir(IntEnum):
-    RIGHT = 0
-    UP = 1
-    LEFT = 2
-    DOWN = 3
-
-    @property
-    def delta(self) -> Pos:
-        return DELTAS[self]
-
-
-@dataclass(frozen=True)
-class Beam:
-    pos: Pos
-    dir: Dir
-
-
 EFFECTS = {
-    ".": [[Dir.RIGHT], [Dir.UP], [Dir.LEFT], [Dir.DOWN]],
-    "/": [[Dir.UP], [Dir.RIGHT], [Dir.DOWN], [Dir.LEFT]],
-    "\\": [[Dir.DOWN], [Dir.LEFT], [Dir.UP], [Dir.RIGHT]],
-    "-": [[Dir.RIGHT], [Dir.RIGHT, Dir.LEFT], [Dir.LEFT], [Dir.RIGHT, Dir.LEFT]],
-    "|": [[Dir.UP, Dir.DOWN], [Dir.UP], [Dir.UP, Dir.DOWN], [Dir.DOWN]],
+    ".": [[RIGHT], [UP], [LEFT], [DOWN]],
+    "/": [[UP], [RIGHT], [DOWN], [LEFT]],
+    "\\": [[DOWN], [LEFT], [UP], [RIGHT]],
+    "-": [[RIGHT], [RIGHT, LEFT], [LEFT], [RIGHT, LEFT]],
+    "|": [[UP, DOWN], [UP], [UP, DOWN], [DOWN]],
 }
+OUTSIDE = " "
 
 
 def solve(reader: io.TextIOBase) -> int:
-    map = Map([line.rstrip() for line in reader])
-
-    def succs(beam: Beam) -> list[Beam]:
-        return [
-            next
-            for dir in EFFECTS[map[beam.pos]][beam.dir]
-            if (next := Beam(beam.pos + dir.delta, dir)).pos in map
+    with phase("parse"):
+        map = Grid.parse(reader, border=OUTSIDE)
+    offsets = map.offsets()
+    outside = ord(OUTSIDE)
+    # A beam is four times its cell's index plus its direction, so every effect
+    # of a cell turns into fixed deltas to add to the beam.
+    moves = {
+        ord(char): [
+            [4 * offsets[new] + new - dir for new in news]
+            for dir, news in enumerate(effects)
         ]
-
-    result = 0
-    (rows, cols) = map.dims()
-    for row in range(rows):
-        for col, dir in [(0, Dir.RIGHT), (cols - 1, Dir.LEFT)]:
-            beams = dfs(Beam(Pos(row, col), dir), succs)
-            result = max(result, len({beam.pos for beam in beams}))
-    for col in range(cols):
-        for row, dir in [(0, Dir.DOWN), (rows - 1, Dir.UP)]:
-            beams = dfs(Beam(Pos(row, col), dir), succs)
-            result = max(result, len({beam.pos for beam in beams}))
-    return result
-
-assert solve(io.StringIO(EXAMPLE_INPUT)) == EXAMPLE_OUTPUT
+        for char, effects in EFFECTS.items()
+    }
+
+    with phase("build"):
+        beams = Graph.build(
+            4 * len(map.cells),
+            (
+                (beam, next)
+                for pos in map.inside()
+                for beam in range(4 * pos, 4 * pos + 4)
+                for delta in moves[map.cells[pos]][beam & 3]
+                if map.cells[(next := beam + delta) >> 2] != outside
+            ),
+        )
+
+    with phase("search"):
+        result = 0
+        for row in range(map.rows):
+            for col, dir in [(0, RIGHT), (map.cols - 1, LEFT)]:
+                found = dfs(beams, [4 * map.index(row, col) + dir])
+                result = max(result, len({beam >> 2 for beam in found}))
+        for col in range(map.cols):
+            for row, dir in [(0, DOWN), (map.rows - 1, UP)]:
+                found = dfs(beams, [4 * map.index(row, col) + dir])
+                result = max(result, len({beam >> 2 for beam in found}))
+        return result
+
+
+@selftest.register
+def test_example() -> None:
+    assert solve(io.StringIO(EXAMPLE_INPUT)) == EXAMPLE_OUTPUT
 
 
 def main():
@@ -117,4 +82,5 @@ def main():
 
 
 if __name__ == "__main__":
+    selftest.run(__name__)
     main()
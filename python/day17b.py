@@ -1,11 +1,10 @@
 from __future__ import annotations
 import io
 import os
-from collections.abc import Callable
-from dataclasses import dataclass
-from enum import IntEnum
-from heapq import heappop, heappush
-import math
+from graph import Graph, dijkstra
+from grid import DOWN, LEFT, RIGHT, UP, Grid
+from profiling import phase
+import selftest
 
 EXAMPLE_INPUT = r"""2413432311323
 3215453535623
@@ -23,105 +22,43 @@ EXAMPLE_INPUT = r"""2413432311323
 EXAMPLE_OUTPUT = 94
 
 
-def dijkstra[
-    T
-](
-    start: set[T],
-    is_target: Callable[[T], bool],
-    edges: Callable[[T], list[tuple[int, T]]],
-) -> int:
-    cheapest = dict[T, int]()
-    queue = list[tuple[int, T]]()
-    for node in start:
-        cheapest[node] = 0
-        heappush(queue, (0, node))
-    count = 0
-    while queue:
-        count += 1
-        (node_cost, node) = heappop(queue)
-        if is_target(node):
-            print(f"{count=}")
-            return node_cost
-        for edge_cost, dest in edges(node):
-            dest_cost = node_cost + edge_cost
-            if dest_cost < cheapest.get(dest, math.inf):
-                cheapest[dest] = dest_cost
-                heappush(queue, (dest_cost, dest))
-    raise Exception("target not found")
-
-
-@dataclass(frozen=True, order=True)
-class Pos:
-    row: int
-    col: int
-
-    def __add__(self, other: Pos) -> Pos:
-        return Pos(self.row + other.row, self.col + other.col)
-
-
-class Map:
-    data: list[list[int]]
-
-    def __init__(self, data: list[list[int]]) -> None:
-        self.data = data
-
-    def dims(self) -> tuple[int, int]:
-        return (len(self.data), len(self.data[0]))
-
-    def __contains__(self, pos: Pos) -> bool:
-        return 0 <= pos.row < len(self.data) and 0 <= pos.col < len(self.data[pos.row])
-
-    def __getitem__(self, pos: Pos) -> int:
-        return self.data[pos.row][pos.col]
-
-
-class Dir(IntEnum):
-    RIGHT = 0
-    UP = 1
-    LEFT = 2
-    DOWN = 3
-
-    @property
-    def delta(self) -> Pos:
-        return DELTAS[self]
-
-    def turned(self) -> tuple[Dir, Dir]:
-        return TURNS[self]
-
-
-DELTAS = (Pos(0, 1), Pos(-1, 0), Pos(0, -1), Pos(1, 0))
-TURNS = 2 * ((Dir.UP, Dir.DOWN), (Dir.RIGHT, Dir.LEFT))
-
-
-@dataclass(frozen=True, order=True)
-class Node:
-    pos: Pos
-    dir: Dir
-    cnt: int  # Number of moves in current direction
+OUTSIDE = "#"
 
 
 def solve(reader: io.TextIOBase) -> int:
-    map = Map([[int(char) for char in line.rstrip()] for line in reader])
-    (rows, cols) = map.dims()
-
-    start = {Node(Pos(0, 0), Dir.RIGHT, 0), Node(Pos(0, 0), Dir.DOWN, 0)}
-    target = Pos(rows - 1, cols - 1)
-    is_target: Callable[[Node], bool] = lambda node: node.pos == target
-
-    def edges(node: Node) -> list[tuple[int, Node]]:
-        dests = list[Node]()
-        if node.cnt < 10:
-            dests.append(Node(node.pos + node.dir.delta, node.dir, node.cnt + 1))
-        if node.cnt >= 4:
-            dests.extend(
-                Node(node.pos + dir.delta, dir, 1) for dir in node.dir.turned()
-            )
-        return [(map[dest.pos], dest) for dest in dests if dest.pos in map]
-
-    return dijkstra(start, is_target, edges)
-
-
-assert solve(io.StringIO(EXAMPLE_INPUT)) == EXAMPLE_OUTPUT
+    with phase("parse"):
+        map = Grid.parse(reader, border=OUTSIDE)
+    offsets = map.offsets()
+    outside = ord(OUTSIDE)
+    axes = ((offsets[RIGHT], offsets[LEFT]), (offsets[UP], offsets[DOWN]))
+
+    # A node is twice a cell's index plus the axis the crucible reached it on,
+    # 0 for a row and 1 for a column. From there it turns and moves four to ten
+    # cells along the other axis.
+    with phase("build"):
+        edges = list[tuple[int, int, int]]()
+        for pos in map.inside():
+            for axis in (0, 1):
+                for offset in axes[1 - axis]:
+                    (dest, loss) = (pos, 0)
+                    for steps in range(1, 11):
+                        dest += offset
+                        if map.cells[dest] == outside:
+                            break
+                        loss += map.cells[dest] - ord("0")
+                        if steps >= 4:
+                            edges.append((2 * pos + axis, 2 * dest + 1 - axis, loss))
+        graph = Graph.build(2 * len(map.cells), edges)
+
+    start = 2 * map.index(0, 0)
+    target = 2 * map.index(map.rows - 1, map.cols - 1)
+    with phase("search"):
+        return dijkstra(graph, {start, start + 1}, {target, target + 1})
+
+
+@selftest.register
+def test_example() -> None:
+    assert solve(io.StringIO(EXAMPLE_INPUT)) == EXAMPLE_OUTPUT
 
 
 def main():
@@ -132,4 +69,5 @@ def main():
 
 
 if __name__ == "__main__":
+    selftest.run(__name__)
     main()
@@ -1,5 +1,6 @@
 import io
 import os
+import selftest
 
 EXAMPLE_INPUT = """R 6 (#70c710)
 D 5 (#0dc571)
@@ -40,7 +41,9 @@ def solve(reader: io.TextIOBase) -> int:
     return (abs(area) + perimeter + 2) // 2
 
 
-assert solve(io.StringIO(EXAMPLE_INPUT)) == EXAMPLE_OUTPUT
+@selftest.register
+def test_example() -> None:
+    assert solve(io.StringIO(EXAMPLE_INPUT)) == EXAMPLE_OUTPUT
 
 
 def main():
@@ -51,4 +54,5 @@ def main():
 
 
 if __name__ == "__main__":
+    selftest.run(__name__)
     main()
@@ -3,6 +3,7 @@ import io
 import os
 import re
 from dataclasses import dataclass
+import selftest
 
 EXAMPLE_INPUT = """px{a<2006:qkq,m>2090:A,rfg}
 pv{a>1716:R,A}
@@ -107,7 +108,9 @@ def solve(reader: io.TextIOBase) -> int:
     return result
 
 
-assert solve(io.StringIO(EXAMPLE_INPUT)) == EXAMPLE_OUTPUT
+@selftest.register
+def test_example() -> None:
+    assert solve(io.StringIO(EXAMPLE_INPUT)) == EXAMPLE_OUTPUT
 
 
 def main():
@@ -118,4 +121,5 @@ def main():
 
 
 if __name__ == "__main__":
+    selftest.run(__name__)
     main()
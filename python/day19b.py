@@ -4,6 +4,7 @@ import os
 import re
 from dataclasses import dataclass
 import math
+import selftest
 
 EXAMPLE_INPUT = """px{a<2006:qkq,m>2090:A,rfg}
 pv{a>1716:R,A}
@@ -119,7 +120,9 @@ def solve(reader: io.TextIOBase) -> int:
     return series.exec(box)
 
 
-assert solve(io.StringIO(EXAMPLE_INPUT)) == EXAMPLE_OUTPUT
+@selftest.register
+def test_example() -> None:
+    assert solve(io.StringIO(EXAMPLE_INPUT)) == EXAMPLE_OUTPUT
 
 
 def main():
@@ -130,4 +133,5 @@ def main():
 
 
 if __name__ == "__main__":
+    selftest.run(__name__)
     main()
@@ -4,6 +4,7 @@ import math
 import os
 from collections import deque
 from dataclasses import dataclass
+import selftest
 
 EXAMPLE_INPUT1 = """broadcaster -> a, b, c
 %a -> b
@@ -118,8 +119,10 @@ def solve(reader: io.TextIOBase) -> int:
     return math.prod(network.count.values())
 
 
-assert solve(io.StringIO(EXAMPLE_INPUT1)) == EXAMPLE_OUTPUT1
-assert solve(io.StringIO(EXAMPLE_INPUT2)) == EXAMPLE_OUTPUT2
+@selftest.register
+def test_example() -> None:
+    assert solve(io.StringIO(EXAMPLE_INPUT1)) == EXAMPLE_OUTPUT1
+    assert solve(io.StringIO(EXAMPLE_INPUT2)) == EXAMPLE_OUTPUT2
 
 
 def main():
@@ -130,4 +133,5 @@ def main():
 
 
 if __name__ == "__main__":
+    selftest.run(__name__)
     main()
@@ -1,8 +1,11 @@
 from __future__ import annotations
-import io
 import os
 from collections.abc import Iterable, Iterator
 from typing import NamedTuple, NewType
+import rawinput
+import resultcache
+from profiling import phase
+import selftest
 
 EXAMPLE_INPUT = """1,0,1~1,2,1
 0,0,2~2,0,2
@@ -40,11 +43,6 @@ class Point3D(NamedTuple):
     y: int
     z: int
 
-    @staticmethod
-    def parse(input: str) -> Point3D:
-        [x, y, z] = input.split(",")
-        return Point3D(int(x), int(y), int(z))
-
     def proj_xy(self) -> Point2D:
         return Point2D(self.x, self.y)
 
@@ -66,43 +64,53 @@ class Brick(NamedTuple):
         return max(self.start.z, self.end.z)
 
     @staticmethod
-    def parse(id: int, input: str) -> Brick:
-        [start, end] = input.split("~")
-        return Brick(Id(id), Point3D.parse(start), Point3D.parse(end))
-
-
-def solve(reader: io.TextIOBase) -> int:
-    bricks = [Brick.parse(id, line.rstrip()) for id, line in enumerate(reader)]
-    bricks.sort(key=lambda b: b.zmin)
-
-    required = set[Id]()
-    heights = dict[Point2D, tuple[int, Brick]]()
-
-    for brick in bricks:
-        span = Span2D(brick.start.proj_xy(), brick.end.proj_xy())
-        max_height = max((heights[p][0] for p in span if p in heights), default=0)
-        support = {
-            hb[1].id
-            for p in span
-            if p in heights and (hb := heights[p])[0] == max_height
-        }
-        if len(support) == 1:
-            required |= support
-        new_height = max_height + brick.zmax - brick.zmin + 1
-        heights |= {p: (new_height, brick) for p in span}
+    def parse(id: int, input: memoryview) -> Brick:
+        [x0, y0, z0, x1, y1, z1] = rawinput.ints(input)
+        return Brick(Id(id), Point3D(x0, y0, z0), Point3D(x1, y1, z1))
+
+
+def parse(data: bytes) -> list[Brick]:
+    with phase("parse"):
+        bricks = [Brick.parse(id, line) for id, line in enumerate(rawinput.lines(data))]
+        bricks.sort(key=lambda b: b.zmin)
+    return bricks
+
+
+def solve(data: bytes) -> int:
+    bricks = resultcache.cached(parse, data)
+
+    with phase("settle"):
+        required = set[Id]()
+        heights = dict[Point2D, tuple[int, Brick]]()
+
+        for brick in bricks:
+            span = Span2D(brick.start.proj_xy(), brick.end.proj_xy())
+            max_height = max((heights[p][0] for p in span if p in heights), default=0)
+            support = {
+                hb[1].id
+                for p in span
+                if p in heights and (hb := heights[p])[0] == max_height
+            }
+            if len(support) == 1:
+                required |= support
+            new_height = max_height + brick.zmax - brick.zmin + 1
+            heights |= {p: (new_height, brick) for p in span}
 
     return len(bricks) - len(required)
 
 
-assert solve(io.StringIO(EXAMPLE_INPUT)) == EXAMPLE_OUTPUT
+@selftest.register
+def test_example() -> None:
+    assert solve(EXAMPLE_INPUT.encode()) == EXAMPLE_OUTPUT
 
 
 def main():
     prefix = os.path.splitext(os.path.basename(__file__))[0][:-1]
-    with open(f"input/{prefix}.txt") as file:
-        solution = solve(file)
+    with rawinput.load(f"input/{prefix}.txt") as data:
+        solution = solve(data)
         print(solution)
 
 
 if __name__ == "__main__":
+    selftest.run(__name__)
     main()
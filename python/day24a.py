@@ -1,10 +1,11 @@
 from __future__ import annotations
-import io
-import re
 import os
 from dataclasses import dataclass
 from fractions import Fraction
 from itertools import combinations
+from profiling import phase
+import rawinput
+import selftest
 
 EXAMPLE_INPUT = """19, 13, 30 @ -2, 1, -2
 18, 19, 22 @ -1, -1, -2
@@ -12,6 +13,7 @@ EXAMPLE_INPUT = """19, 13, 30 @ -2, 1, -2
 12, 31, 28 @ -1, -2, -1
 20, 19, 15 @  1, -5, -3"""
 EXAMPLE_RANGE = (Fraction(7), Fraction(27))
+RANGE = (Fraction(200_000_000_000_000), Fraction(400_000_000_000_000))
 EXAMPLE_OUTPUT = 2
 
 
@@ -37,9 +39,6 @@ def det(a: Point2D, b: Point2D) -> Fraction:
     return a.x * b.y - a.y * b.x
 
 
-POINT3D_RE = re.compile(r"(-?\d+),\s*(-?\d+),\s*(-?\d+)")
-
-
 @dataclass
 class Point3D:
     x: Fraction
@@ -49,12 +48,6 @@ class Point3D:
     def proj_xy(self) -> Point2D:
         return Point2D(self.x, self.y)
 
-    @staticmethod
-    def parse(input: str) -> Point3D:
-        m = POINT3D_RE.fullmatch(input)
-        assert m is not None, f"bad input: «{input}»"
-        return Point3D(Fraction(m[1]), Fraction(m[2]), Fraction(m[3]))
-
 
 @dataclass
 class Ray2D:
@@ -76,15 +69,17 @@ class Ray2D:
         return f"{self.pos} + λ⋅{self.dir}"
 
 
-assert Ray2D(
-    Point2D(Fraction(19), Fraction(13)), Point2D(Fraction(-2), Fraction(1))
-).intersection(
-    Ray2D(Point2D(Fraction(18), Fraction(19)), Point2D(Fraction(-1), Fraction(-1)))
-) == (
-    Point2D(Fraction(43, 3), Fraction(46, 3)),
-    Fraction(7, 3),
-    Fraction(11, 3),
-)
+@selftest.register
+def test_intersection() -> None:
+    assert Ray2D(
+        Point2D(Fraction(19), Fraction(13)), Point2D(Fraction(-2), Fraction(1))
+    ).intersection(
+        Ray2D(Point2D(Fraction(18), Fraction(19)), Point2D(Fraction(-1), Fraction(-1)))
+    ) == (
+        Point2D(Fraction(43, 3), Fraction(46, 3)),
+        Fraction(7, 3),
+        Fraction(11, 3),
+    )
 
 
 @dataclass
@@ -96,13 +91,14 @@ class Ray3D:
         return Ray2D(self.pos.proj_xy(), self.dir.proj_xy())
 
     @staticmethod
-    def parse(input: str) -> Ray3D:
-        [pos, dir] = input.split("@")
-        return Ray3D(Point3D.parse(pos.strip()), Point3D.parse(dir.strip()))
+    def parse(input: memoryview) -> Ray3D:
+        [px, py, pz, dx, dy, dz] = map(Fraction, rawinput.ints(input))
+        return Ray3D(Point3D(px, py, pz), Point3D(dx, dy, dz))
 
 
-def solve(reader: io.TextIOBase, range: tuple[Fraction, Fraction]) -> int:
-    rays = [Ray3D.parse(line).proj_xy() for line in reader]
+def solve(data: bytes, range: tuple[Fraction, Fraction]) -> int:
+    with phase("parse"):
+        rays = [Ray3D.parse(line).proj_xy() for line in rawinput.lines(data)]
     count = 0
     for r1, r2 in combinations(rays, 2):
         pst = r1.intersection(r2)
@@ -119,17 +115,18 @@ def solve(reader: io.TextIOBase, range: tuple[Fraction, Fraction]) -> int:
     return count
 
 
-assert solve(io.StringIO(EXAMPLE_INPUT), EXAMPLE_RANGE) == EXAMPLE_OUTPUT
+@selftest.register
+def test_example() -> None:
+    assert solve(EXAMPLE_INPUT.encode(), EXAMPLE_RANGE) == EXAMPLE_OUTPUT
 
 
 def main():
     prefix = os.path.splitext(os.path.basename(__file__))[0][:-1]
-    with open(f"input/{prefix}.txt") as file:
-        solution = solve(
-            file, (Fraction(200_000_000_000_000), Fraction(400_000_000_000_000))
-        )
+    with rawinput.load(f"input/{prefix}.txt") as data:
+        solution = solve(data, RANGE)
         print(solution)
 
 
 if __name__ == "__main__":
+    selftest.run(__name__)
     main()
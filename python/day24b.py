@@ -1,11 +1,12 @@
 # pyright: reportUnknownMemberType=false, reportUnknownArgumentType=false
 from __future__ import annotations
-import io
-import re
 import os
 import z3  # type: ignore
 from dataclasses import dataclass
 from fractions import Fraction
+from profiling import phase
+import rawinput
+import selftest
 
 EXAMPLE_INPUT = """19, 13, 30 @ -2, 1, -2
 18, 19, 22 @ -1, -1, -2
@@ -13,24 +14,16 @@ EXAMPLE_INPUT = """19, 13, 30 @ -2, 1, -2
 12, 31, 28 @ -1, -2, -1
 20, 19, 15 @  1, -5, -3"""
 EXAMPLE_RANGE = (Fraction(7), Fraction(27))
+RANGE = (Fraction(200_000_000_000_000), Fraction(400_000_000_000_000))
 EXAMPLE_OUTPUT = 47
 
 
-POINT3D_RE = re.compile(r"(-?\d+),\s*(-?\d+),\s*(-?\d+)")
-
-
 @dataclass
 class Point3D:
     x: Fraction
     y: Fraction
     z: Fraction
 
-    @staticmethod
-    def parse(input: str) -> Point3D:
-        m = POINT3D_RE.fullmatch(input)
-        assert m is not None, f"bad input: «{input}»"
-        return Point3D(Fraction(m[1]), Fraction(m[2]), Fraction(m[3]))
-
 
 @dataclass
 class Ray3D:
@@ -38,13 +31,14 @@ class Ray3D:
     dir: Point3D
 
     @staticmethod
-    def parse(input: str) -> Ray3D:
-        [pos, dir] = input.split("@")
-        return Ray3D(Point3D.parse(pos.strip()), Point3D.parse(dir.strip()))
+    def parse(input: memoryview) -> Ray3D:
+        [px, py, pz, dx, dy, dz] = map(Fraction, rawinput.ints(input))
+        return Ray3D(Point3D(px, py, pz), Point3D(dx, dy, dz))
 
 
-def solve(reader: io.TextIOBase, range: tuple[Fraction, Fraction]) -> int:
-    rays = [Ray3D.parse(line) for line in reader]
+def solve(data: bytes, range: tuple[Fraction, Fraction]) -> int:
+    with phase("parse"):
+        rays = [Ray3D.parse(line) for line in rawinput.lines(data)]
     [px, py, pz, dx, dy, dz] = vars = [
         z3.Int(name) for name in ["px", "py", "pz", "dx", "dy", "dz"]
     ]
@@ -61,17 +55,18 @@ def solve(reader: io.TextIOBase, range: tuple[Fraction, Fraction]) -> int:
     return sum(m[v].as_long() for v in vars[:3])  # type: ignore
 
 
-assert solve(io.StringIO(EXAMPLE_INPUT), EXAMPLE_RANGE) == EXAMPLE_OUTPUT
+@selftest.register
+def test_example() -> None:
+    assert solve(EXAMPLE_INPUT.encode(), EXAMPLE_RANGE) == EXAMPLE_OUTPUT
 
 
 def main():
     prefix = os.path.splitext(os.path.basename(__file__))[0][:-1]
-    with open(f"input/{prefix}.txt") as file:
-        solution = solve(
-            file, (Fraction(200_000_000_000_000), Fraction(400_000_000_000_000))
-        )
+    with rawinput.load(f"input/{prefix}.txt") as data:
+        solution = solve(data, RANGE)
         print(solution)
 
 
 if __name__ == "__main__":
+    selftest.run(__name__)
     main()
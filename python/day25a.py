@@ -1,9 +1,10 @@
 from __future__ import annotations
 import io
-import math
 import os
-from collections.abc import Iterable
-from typing import NewType
+from graph import Graph, minimum_cut
+from profiling import phase
+import resultcache
+import selftest
 
 EXAMPLE_INPUT = """jqt: rhn xhk nvd
 rsh: frs pzl lsr
@@ -21,100 +22,37 @@ frs: qnr lhk lsr"""
 EXAMPLE_OUTPUT = 54
 
 
-class Graph[V]:
-    edges: dict[V, dict[V, int]]
-
-    def __init__(self):
-        self.edges = {}
-
-    def add_edge(self, u: V, v: V, w: int) -> None:
-        assert u != v
-        self.edges.setdefault(u, {}).setdefault(v, 0)
-        self.edges[u][v] += w
-        self.edges.setdefault(v, {}).setdefault(u, 0)
-        self.edges[v][u] += w
-
-    def remove_node(self, v: V) -> None:
-        assert v in self.edges
-        for u in self.edges[v]:
-            del self.edges[u][v]
-        del self.edges[v]
-
-    def __getitem__(self, uv: tuple[V, V]) -> int:
-        (u, v) = uv
-        return self.edges.get(u, {}).get(v, 0)
-
-    def node_count(self) -> int:
-        return len(self.edges)
-
-    def nodes(self) -> Iterable[V]:
-        return self.edges.keys()
-
-    def neighbours(self, v: V) -> Iterable[V]:
-        return self.edges[v].keys()
-
-    def merge_into(self, u: V, v: V) -> None:
-        es = self.edges[u]
-        for n, w in es.items():
-            if n != v:
-                self.add_edge(v, n, w)
-        self.remove_node(u)
-
-
-def minimum_cut_phase[V](g: Graph[V], a: V) -> tuple[int, V, V]:
-    A = {a}
-    B = {v: g[a, v] for v in g.nodes()}
-    del B[a]
-    b1 = a
-    while len(B) > 1:
-        (_, v) = max((B[u], u) for u in B)
-        A.add(v)
-        del B[v]
-        for u in g.neighbours(v):
-            if u in B:
-                B[u] += g[u, v]
-        b1 = v
-    (b0, cut) = B.popitem()
-    return (cut, b0, b1)
-
-
-def minimum_cut[V](g: Graph[V]) -> tuple[int, int]:
-    assert g.node_count() >= 2
-    a = next(iter(g.nodes()))
-    cluster_sizes = {v: 1 for v in g.nodes()}
-    min_cut: int = math.inf  # type: ignore
-    min_split = 0
-    while g.node_count() > 1:
-        print(f"starting loop with {g.node_count()} nodes")
-        (cut, b0, b1) = minimum_cut_phase(g, a)
-        if cut < min_cut:
-            min_cut = cut
-            min_split = cluster_sizes[b0]
-        g.merge_into(b1, b0)
-        cluster_sizes[b0] += cluster_sizes[b1]
-        del cluster_sizes[b1]
-    return (min_cut, min_split)
-
-
-Node = NewType("Node", str)
+def wiring(text: str) -> Graph:
+    with phase("parse"):
+        ids = dict[str, int]()
+        edges = list[tuple[int, int]]()
+        for line in text.splitlines():
+            [v, *us] = line.split()
+            v = ids.setdefault(v.rstrip(":"), len(ids))
+            for u in us:
+                edges.append((ids.setdefault(u, len(ids)), v))
+    with phase("build"):
+        return Graph.build(len(ids), edges, symmetric=True)
 
 
 def solve(reader: io.TextIOBase) -> int:
-    g = Graph[Node]()
-    for line in reader:
-        [v, *us] = line.rstrip().split()
-        v = v.rstrip(":")
-        for u in us:
-            g.add_edge(Node(u), Node(v), 1)
-
-    n = g.node_count()
-    (cut, split) = minimum_cut(g)
-    assert cut == 3
+    graph = resultcache.cached(wiring, reader.read())
+    n = graph.size
 
-    return split * (n - split)
+    # The three wires form the only cut of size three, so the maximum flow from
+    # node 0 is three exactly to the nodes on the other side of it.
+    with phase("search"):
+        for sink in range(1, n):
+            (cut, side) = minimum_cut(graph, 0, sink, limit=3)
+            if cut == 3:
+                split = sum(side)
+                return split * (n - split)
+    raise Exception("no cut of size three")
 
 
-assert solve(io.StringIO(EXAMPLE_INPUT)) == EXAMPLE_OUTPUT
+@selftest.register
+def test_example() -> None:
+    assert solve(io.StringIO(EXAMPLE_INPUT)) == EXAMPLE_OUTPUT
 
 
 def main():
@@ -125,4 +63,5 @@ def main():
 
 
 if __name__ == "__main__":
+    selftest.run(__name__)
     main()
@@ -0,0 +1,648 @@
+from __future__ import annotations
+import argparse
+import collections
+import math
+import random
+import re
+import string
+import sys
+from collections.abc import Callable, Iterator
+
+# Every generator takes a seeded random number generator and a scale factor and
+# returns the text of an input file. A scale of 1 produces an input roughly the
+# size of the real one; larger scales multiply the number of lines or, for grid
+# puzzles, the number of cells.
+
+type Generator = Callable[[random.Random, float], str]
+type Cell = tuple[int, int]
+
+DIGIT_NAMES = ["one", "two", "three", "four", "five", "six", "seven", "eight", "nine"]
+
+
+def scaled(base: int, scale: float) -> int:
+    return max(1, round(base * scale))
+
+
+def side(base: int, scale: float) -> int:
+    return max(3, round(base * math.sqrt(scale)))
+
+
+def names(rng: random.Random, count: int, alphabet: str, length: int) -> list[str]:
+    assert count <= len(alphabet) ** length, "not enough distinct names"
+    result = set[str]()
+    while len(result) < count:
+        result.add("".join(rng.choices(alphabet, k=length)))
+    return sorted(result, key=lambda _: rng.random())
+
+
+def day01(rng: random.Random, scale: float) -> str:
+    lines = []
+    for _ in range(scaled(1000, scale)):
+        parts = []
+        for _ in range(rng.randint(2, 8)):
+            match rng.randrange(3):
+                case 0:
+                    parts.append(str(rng.randint(1, 9)))
+                case 1:
+                    parts.append(rng.choice(DIGIT_NAMES))
+                case _:
+                    parts.append("".join(rng.choices(string.ascii_lowercase, k=3)))
+        parts.insert(rng.randint(0, len(parts)), str(rng.randint(1, 9)))
+        lines.append("".join(parts))
+    return "\n".join(lines)
+
+
+def day02(rng: random.Random, scale: float) -> str:
+    lines = []
+    for id in range(1, scaled(100, scale) + 1):
+        rounds = []
+        for _ in range(rng.randint(1, 6)):
+            colors = rng.sample(["red", "green", "blue"], rng.randint(1, 3))
+            rounds.append(", ".join(f"{rng.randint(1, 20)} {c}" for c in colors))
+        lines.append(f"Game {id}: " + "; ".join(rounds))
+    return "\n".join(lines)
+
+
+def day03(rng: random.Random, scale: float) -> str:
+    n = side(140, scale)
+    grid = [["."] * n for _ in range(n)]
+    for row in grid:
+        col = rng.randint(0, 3)
+        while col < n:
+            if rng.random() < 0.35:
+                for i, digit in enumerate(str(rng.randint(1, 999))):
+                    if col + i < n:
+                        row[col + i] = digit
+            elif rng.random() < 0.15:
+                row[col] = rng.choice("*****#$%&+-/=@")
+            col += rng.randint(4, 7)
+    return "\n".join("".join(row) for row in grid)
+
+
+def day04(rng: random.Random, scale: float) -> str:
+    n = scaled(200, scale)
+    lines = []
+    for id in range(1, n + 1):
+        # Fewer than one match per card on average keeps the number of copies
+        # from growing exponentially, and no card may win past the table's end.
+        matches = min(rng.choice([0] * 14 + [1, 1, 2, 3, 10]), n - id)
+        winning = rng.sample(range(1, 100), 10)
+        others = [k for k in range(1, 100) if k not in winning]
+        have = rng.sample(winning, matches) + rng.sample(others, 25 - matches)
+        rng.shuffle(have)
+        lines.append(
+            f"Card {id:>{len(str(n))}}: "
+            + " ".join(f"{k:2}" for k in winning)
+            + " | "
+            + " ".join(f"{k:2}" for k in have)
+        )
+    return "\n".join(lines)
+
+
+def day05(rng: random.Random, scale: float) -> str:
+    limit = 2**32
+    seeds = []
+    for _ in range(scaled(10, scale)):
+        start = rng.randrange(limit)
+        seeds += [start, rng.randint(1, min(limit - start, 500_000_000))]
+    stages = ["seed", "soil", "fertilizer", "water", "light", "temperature"]
+    stages += ["humidity", "location"]
+    blocks = ["seeds: " + " ".join(map(str, seeds))]
+    for source, dest in zip(stages, stages[1:]):
+        # Shuffle the pieces of a partition of [0, limit) to get a bijection.
+        cuts = sorted(rng.sample(range(1, limit), scaled(30, scale)))
+        pieces = list(zip([0] + cuts, cuts + [limit]))
+        rng.shuffle(pieces)
+        entries = []
+        dest_start = 0
+        for start, end in pieces:
+            entries.append(f"{dest_start} {start} {end - start}")
+            dest_start += end - start
+        rng.shuffle(entries)
+        blocks.append("\n".join([f"{source}-to-{dest} map:"] + entries))
+    return "\n\n".join(blocks)
+
+
+def day06(rng: random.Random, scale: float) -> str:
+    # Times have two and distances three digits, which keeps the concatenated
+    # race of part two winnable.
+    times, dists = [], []
+    for _ in range(scaled(4, scale)):
+        time = rng.randint(40, 99)
+        times.append(time)
+        dists.append(rng.randint(100, time * time // 4 - 1))
+    time_line = "Time:     " + " ".join(f"{t:>3}" for t in times)
+    dist_line = "Distance: " + " ".join(f"{d:>3}" for d in dists)
+    return time_line + "\n" + dist_line
+
+
+def day07(rng: random.Random, scale: float) -> str:
+    lines = []
+    for _ in range(scaled(1000, scale)):
+        hand = "".join(rng.choices("23456789TJQKA", k=5))
+        lines.append(f"{hand} {rng.randint(1, 1000)}")
+    return "\n".join(lines)
+
+
+def day08(rng: random.Random, scale: float) -> str:
+    # Every ghost runs around its own cycle of prime length, which contains
+    # exactly one node ending in Z. Both successors of a cycle node are the same,
+    # so the walk does not depend on the instructions.
+    alphabet = string.ascii_uppercase + string.digits
+    lengths = set[int]()
+    while len(lengths) < 6:
+        if is_prime(length := rng.randint(scaled(60, scale), scaled(600, scale))):
+            lengths.add(length)
+    inner = names(rng, sum(lengths), alphabet.replace("A", "").replace("Z", ""), 3)
+    starts = ["AAA"] + [n + "A" for n in names(rng, 6, alphabet, 2) if n != "AA"][:5]
+    ends = ["ZZZ"] + [n + "Z" for n in names(rng, 6, alphabet, 2) if n != "ZZ"][:5]
+    lines = []
+    for start, end, length in zip(starts, ends, lengths):
+        cycle = [end] + [inner.pop() for _ in range(length - 1)]
+        lines.append(f"{start} = ({cycle[1]}, {cycle[1]})")
+        for i, node in enumerate(cycle):
+            succ = cycle[(i + 1) % length]
+            lines.append(f"{node} = ({succ}, {succ})")
+    rng.shuffle(lines)
+    dirs = "".join(rng.choices("LR", k=scaled(281, scale)))
+    return dirs + "\n\n" + "\n".join(lines)
+
+
+def is_prime(n: int) -> bool:
+    return n >= 2 and all(n % k != 0 for k in range(2, math.isqrt(n) + 1))
+
+
+def day09(rng: random.Random, scale: float) -> str:
+    lines = []
+    for _ in range(scaled(200, scale)):
+        coeffs = [rng.randint(-9, 9) for _ in range(rng.randint(1, 8))]
+        values = [sum(c * x**k for k, c in enumerate(coeffs)) for x in range(21)]
+        lines.append(" ".join(map(str, values)))
+    return "\n".join(lines)
+
+
+def tree_outline(rng: random.Random, n: int) -> tuple[list[Cell], set[Cell]]:
+    # The outline of a thickened random tree: nodes become 3x3 blocks and edges
+    # 3x1 corridors between them, so the shape has neither holes nor cells that
+    # touch only at a corner. Returns the loop in order and the cells inside it.
+    k = (n - 3) // 4
+    assert k >= 1, "grid too small"
+    root = (rng.randrange(k), rng.randrange(k))
+    shape = set[Cell]()
+    seen = {root}
+    frontier = [root]
+    while frontier:
+        (i, j) = frontier.pop(rng.randrange(len(frontier)))
+        shape.update(
+            (4 * i + 2 + di, 4 * j + 2 + dj) for di in range(3) for dj in range(3)
+        )
+        for di, dj in ((0, 1), (1, 0), (0, -1), (-1, 0)):
+            (ni, nj) = (i + di, j + dj)
+            if (
+                0 <= ni < k
+                and 0 <= nj < k
+                and (ni, nj) not in seen
+                and rng.random() < 0.7
+            ):
+                seen.add((ni, nj))
+                frontier.append((ni, nj))
+                if di == 0:
+                    col = 4 * min(j, nj) + 5
+                    shape.update((4 * i + 2 + d, col) for d in range(3))
+                else:
+                    row = 4 * min(i, ni) + 5
+                    shape.update((row, 4 * j + 2 + d) for d in range(3))
+    ring = {
+        (r, c)
+        for (r, c) in shape
+        if any((r + dr, c + dc) not in shape for dr in (-1, 0, 1) for dc in (-1, 0, 1))
+    }
+    start = min(ring)
+    loop = [start]
+    prev = None
+    curr = start
+    while True:
+        (r, c) = curr
+        succ = next(
+            p
+            for p in ((r, c + 1), (r + 1, c), (r, c - 1), (r - 1, c))
+            if p in ring and p != prev
+        )
+        if succ == start:
+            break
+        loop.append(succ)
+        (prev, curr) = (curr, succ)
+    assert len(loop) == len(ring)
+    return (loop, shape - ring)
+
+
+PIPES = {
+    frozenset({(-1, 0), (1, 0)}): "|",
+    frozenset({(0, -1), (0, 1)}): "-",
+    frozenset({(-1, 0), (0, 1)}): "L",
+    frozenset({(-1, 0), (0, -1)}): "J",
+    frozenset({(1, 0), (0, -1)}): "7",
+    frozenset({(1, 0), (0, 1)}): "F",
+}
+
+
+def day10(rng: random.Random, scale: float) -> str:
+    n = side(140, scale)
+    (loop, _) = tree_outline(rng, n)
+    grid = [[rng.choice("|-LJ7F.") for _ in range(n)] for _ in range(n)]
+    for i, (r, c) in enumerate(loop):
+        (pr, pc) = loop[i - 1]
+        (nr, nc) = loop[(i + 1) % len(loop)]
+        grid[r][c] = PIPES[frozenset({(pr - r, pc - c), (nr - r, nc - c)})]
+    # Keep the start unambiguous: no stray pipe next to it may point at it.
+    (r, c) = loop[rng.randrange(len(loop))]
+    grid[r][c] = "S"
+    on_loop = set(loop)
+    for dr, dc in ((-1, 0), (1, 0), (0, -1), (0, 1)):
+        if (r + dr, c + dc) not in on_loop:
+            grid[r + dr][c + dc] = "."
+    return "\n".join("".join(row) for row in grid)
+
+
+def day11(rng: random.Random, scale: float) -> str:
+    n = side(140, scale)
+    empty_rows = set(rng.sample(range(n), n // 14))
+    empty_cols = set(rng.sample(range(n), n // 14))
+    return "\n".join(
+        "".join(
+            (
+                "#"
+                if i not in empty_rows and j not in empty_cols and rng.random() < 0.022
+                else "."
+            )
+            for j in range(n)
+        )
+        for i in range(n)
+    )
+
+
+def day12(rng: random.Random, scale: float) -> str:
+    lines = []
+    for _ in range(scaled(1000, scale)):
+        groups = [rng.randint(1, 6) for _ in range(rng.randint(1, 6))]
+        springs = "." * rng.randint(0, 2)
+        for g in groups:
+            springs += "#" * g + "." * rng.randint(1, 3)
+        springs = "".join(c if rng.random() < 0.5 else "?" for c in springs)
+        lines.append(f"{springs} {','.join(map(str, groups))}")
+    return "\n".join(lines)
+
+
+def reflection_defects(pattern: list[str]) -> list[int]:
+    # Number of mismatching cells for every horizontal mirror line.
+    return [
+        sum(
+            a != b
+            for j in range(min(i, len(pattern) - i))
+            for a, b in zip(pattern[i - 1 - j], pattern[i + j])
+        )
+        for i in range(1, len(pattern))
+    ]
+
+
+def day13(rng: random.Random, scale: float) -> str:
+    patterns = []
+    while len(patterns) < scaled(100, scale):
+        # Make the pattern symmetric at a vertical line and at a horizontal line,
+        # then smudge a cell that only breaks the horizontal symmetry.
+        (h, w) = (rng.choice(range(7, 18, 2)), rng.choice(range(7, 18, 2)))
+        (col_mirror, row_mirror) = (rng.randint(1, w - 1), rng.randint(1, h - 1))
+        col_reach = min(col_mirror, w - col_mirror)
+        row_reach = min(row_mirror, h - row_mirror)
+        rows = []
+        for _ in range(h):
+            row = rng.choices(".#", k=w)
+            for j in range(col_reach):
+                row[col_mirror + j] = row[col_mirror - 1 - j]
+            rows.append(row)
+        for j in range(row_reach):
+            rows[row_mirror + j] = rows[row_mirror - 1 - j][:]
+        r = rng.randrange(row_mirror - row_reach, row_mirror + row_reach)
+        c = rng.choice(
+            [
+                c
+                for c in range(w)
+                if not col_mirror - col_reach <= c < col_mirror + col_reach
+            ]
+        )
+        rows[r][c] = "#" if rows[r][c] == "." else "."
+        rows = ["".join(row) for row in rows]
+        if rng.random() < 0.5:
+            rows = ["".join(col) for col in zip(*rows)]
+        # Keep only patterns with exactly one clean and one smudged reflection.
+        defects = reflection_defects(rows)
+        defects += reflection_defects(["".join(col) for col in zip(*rows)])
+        if defects.count(0) == 1 and defects.count(1) == 1:
+            patterns.append("\n".join(rows))
+    return "\n\n".join(patterns)
+
+
+def day14(rng: random.Random, scale: float) -> str:
+    n = side(100, scale)
+    return "\n".join(
+        "".join(rng.choices("O#.", weights=(20, 15, 65), k=n)) for _ in range(n)
+    )
+
+
+def day15(rng: random.Random, scale: float) -> str:
+    labels = names(rng, scaled(500, scale), string.ascii_lowercase, 4)
+    steps = []
+    for _ in range(scaled(4000, scale)):
+        label = rng.choice(labels)[: rng.randint(2, 4)]
+        steps.append(label + ("-" if rng.random() < 0.4 else f"={rng.randint(1, 9)}"))
+    return ",".join(steps)
+
+
+def day16(rng: random.Random, scale: float) -> str:
+    n = side(110, scale)
+    rows = [
+        "".join(rng.choices(".|-/\\", weights=(90, 2.5, 2.5, 2.5, 2.5), k=n))
+        for _ in range(n)
+    ]
+    # As in the real input, send part one's beam down into the grid at once
+    # rather than letting it leave along the top row.
+    rows[0] = "\\" + rows[0][1:]
+    return "\n".join(rows)
+
+
+def day17(rng: random.Random, scale: float) -> str:
+    n = side(141, scale)
+    return "\n".join("".join(rng.choices("123456789", k=n)) for _ in range(n))
+
+
+def day18(rng: random.Random, scale: float) -> str:
+    # Trace the outline of a random shape and stretch it for part two.
+    (loop, _) = tree_outline(rng, side(60, scale))
+    moves: list[tuple[Cell, int]] = []
+    for (r0, c0), (r1, c1) in zip(loop, loop[1:] + loop[:1]):
+        delta = (r1 - r0, c1 - c0)
+        if moves and moves[-1][0] == delta:
+            moves[-1] = (delta, moves[-1][1] + 1)
+        else:
+            moves.append((delta, 1))
+    if moves[0][0] == moves[-1][0]:
+        moves[0] = (moves[0][0], moves[0][1] + moves.pop()[1])
+    limit = (16**5 - 1) // max(length for _, length in moves)
+    (stretch_r, stretch_c) = (
+        rng.randint(1, min(5000, limit)),
+        rng.randint(1, min(5000, limit)),
+    )
+    dirs = {(0, 1): ("R", 0), (1, 0): ("D", 1), (0, -1): ("L", 2), (-1, 0): ("U", 3)}
+    lines = []
+    for delta, length in moves:
+        (dir, code) = dirs[delta]
+        hex_length = length * (stretch_c if delta[0] == 0 else stretch_r)
+        lines.append(f"{dir} {length} (#{hex_length:05x}{code})")
+    return "\n".join(lines)
+
+
+def day19(rng: random.Random, scale: float) -> str:
+    count = scaled(550, scale)
+    flows = ["in"] + names(
+        rng, count - 1, string.ascii_lowercase, 3 if count < 5000 else 4
+    )
+    lines = []
+    # Like the real input the workflows form a tree: each one is sent to from a
+    # single rule of an earlier workflow, so none can loop. Every workflow only
+    # splits the ratings that can actually reach it, which day19b relies on.
+    unused = collections.deque(range(1, count))
+    boxes = {0: {p: (1, 4001) for p in "xmas"}}
+    for i, name in enumerate(flows):
+        box = boxes.pop(i, None) or {p: (1, 4001) for p in "xmas"}
+
+        def target(box: dict[str, tuple[int, int]]) -> str:
+            if not unused or unused[0] <= i or rng.random() < 0.3:
+                return rng.choice("AR")
+            boxes[unused[0]] = box
+            return flows[unused.popleft()]
+
+        rules = []
+        for _ in range(rng.randint(1, 3)):
+            splittable = [p for p, (lo, hi) in box.items() if hi - lo >= 2]
+            if not splittable:
+                break
+            prop = rng.choice(splittable)
+            (lo, hi) = box[prop]
+            if rng.random() < 0.5:
+                val = rng.randint(lo + 1, hi - 1)
+                (matches, rest) = ((lo, val), (val, hi))
+                rule = f"{prop}<{val}"
+            else:
+                val = rng.randint(lo, hi - 2)
+                (matches, rest) = ((val + 1, hi), (lo, val + 1))
+                rule = f"{prop}>{val}"
+            rules.append(f"{rule}:{target(box | {prop: matches})}")
+            box = box | {prop: rest}
+        lines.append(f"{name}{{{','.join(rules)},{target(box)}}}")
+    rng.shuffle(lines)
+    parts = [
+        "{" + ",".join(f"{p}={rng.randint(1, 4000)}" for p in "xmas") + "}"
+        for _ in range(scaled(200, scale))
+    ]
+    return "\n".join(lines) + "\n\n" + "\n".join(parts)
+
+
+def day20(rng: random.Random, scale: float) -> str:
+    # The usual shape: the broadcaster feeds twelve-bit counters, each of which
+    # pulses a conjunction once its count reaches a prime. Day20b expects those
+    # conjunctions to feed `kh`, which feeds `rx`.
+    chains = scaled(4, scale)
+    pool = names(rng, 14 * chains + 2, string.ascii_lowercase, 2 if chains < 40 else 3)
+    pool = [name for name in pool if name not in {"kh", "rx"}]
+    primes = [p for p in range(2**11 + 1, 2**12, 2) if is_prime(p)]
+    lines = []
+    broadcast = []
+    for period in rng.sample(primes, chains):
+        flops = [pool.pop() for _ in range(12)]
+        (hub, inverter) = (pool.pop(), pool.pop())
+        broadcast.append(flops[0])
+        hub_dsts = []
+        for bit, flop in enumerate(flops):
+            dsts = flops[bit + 1 : bit + 2]
+            if period >> bit & 1:
+                dsts.append(hub)
+            if bit == 0 or not period >> bit & 1:
+                hub_dsts.append(flop)
+            lines.append(f"%{flop} -> {', '.join(dsts)}")
+        lines.append(f"&{hub} -> {', '.join(hub_dsts + [inverter])}")
+        lines.append(f"&{inverter} -> kh")
+    lines.append("&kh -> rx")
+    lines.append(f"broadcaster -> {', '.join(broadcast)}")
+    rng.shuffle(lines)
+    return "\n".join(lines)
+
+
+def day21(rng: random.Random, scale: float) -> str:
+    # Like the real input, the middle row and column and the border are open.
+    n = side(131, scale) | 1
+    mid = n // 2
+    grid = [
+        [
+            "#" if 0 < i < n - 1 and 0 < j < n - 1 and rng.random() < 0.15 else "."
+            for j in range(n)
+        ]
+        for i in range(n)
+    ]
+    for k in range(n):
+        grid[mid][k] = grid[k][mid] = "."
+    grid[mid][mid] = "S"
+    return "\n".join("".join(row) for row in grid)
+
+
+def day22(rng: random.Random, scale: float) -> str:
+    count = scaled(1250, scale)
+    height = max(10, count // 4)
+    occupied = set[tuple[int, int, int]]()
+    lines = []
+    while len(lines) < count:
+        (x, y, z) = (rng.randrange(10), rng.randrange(10), rng.randint(1, height))
+        (axis, length) = (rng.randrange(3), rng.randint(1, 4))
+        end = [x, y, z]
+        end[axis] += length - 1
+        if end[0] > 9 or end[1] > 9:
+            continue
+        cubes = {
+            (a, b, c)
+            for a in range(x, end[0] + 1)
+            for b in range(y, end[1] + 1)
+            for c in range(z, end[2] + 1)
+        }
+        if cubes & occupied:
+            continue
+        occupied |= cubes
+        lines.append(f"{x},{y},{z}~{end[0]},{end[1]},{end[2]}")
+    return "\n".join(lines)
+
+
+def corridor(
+    rng: random.Random, start: Cell, end: Cell, bump: Cell | None
+) -> Iterator[Cell]:
+    # Cells strictly between two junctions on the same row or column. Unless
+    # `bump` is None the corridor makes a detour in that direction within its
+    # first half, so that corridors have different lengths.
+    (r, c) = start
+    (dr, dc) = ((end[0] > r) - (end[0] < r), (end[1] > c) - (end[1] < c))
+    length = abs(end[0] - r) + abs(end[1] - c)
+    offset = rng.randint(3, length // 2 - 3)
+    width = rng.randint(2, length // 2 - offset)
+    depth = 0 if bump is None else rng.randint(0, length // 2 - 3)
+    for step in range(1, length):
+        (r, c) = (r + dr, c + dc)
+        if depth > 0 and offset < step < offset + width:
+            continue
+        yield (r, c)
+        if depth > 0 and step == offset:
+            (br, bc) = bump  # type: ignore
+            for d in range(1, depth + 1):
+                yield (r + d * br, c + d * bc)
+            for w in range(1, width):
+                yield (r + depth * br + w * dr, c + depth * bc + w * dc)
+            for d in range(depth, 0, -1):
+                yield (r + d * br + width * dr, c + d * bc + width * dc)
+
+
+def day23(rng: random.Random, scale: float) -> str:
+    # Junctions sit on a lattice and are joined to their right and lower
+    # neighbours. Slopes around every junction point right or down, so the
+    # slippery maze of part one is acyclic.
+    spacing = 22
+    k = max(2, round(6 * math.sqrt(scale)))
+    n = spacing * (k - 1) + 2 * 5 + 1
+    junctions = [
+        [(5 + spacing * i, 5 + spacing * j) for j in range(k)] for i in range(k)
+    ]
+    grid = [["#"] * n for _ in range(n)]
+    for i in range(k):
+        for j in range(k):
+            (r, c) = junctions[i][j]
+            grid[r][c] = "."
+            # Detours on the outer edges would leave the grid or collide.
+            if j + 1 < k:
+                bump = (-1, 0) if i > 0 else None
+                for rr, cc in corridor(rng, (r, c), junctions[i][j + 1], bump):
+                    grid[rr][cc] = "."
+                grid[r][c + 1] = grid[r][c + spacing - 1] = ">"
+            if i + 1 < k:
+                bump = (0, -1) if j > 0 else None
+                for rr, cc in corridor(rng, (r, c), junctions[i + 1][j], bump):
+                    grid[rr][cc] = "."
+                grid[r + 1][c] = grid[r + spacing - 1][c] = "v"
+    for r in range(0, 6):
+        grid[r][1] = "."
+    for c in range(1, 5):
+        grid[5][c] = "."
+    grid[5][4] = ">"
+    (r, c) = junctions[-1][-1]
+    for cc in range(c + 1, n - 1):
+        grid[r][cc] = "."
+    grid[r][c + 1] = ">"
+    for rr in range(r, n):
+        grid[rr][n - 2] = "."
+    return "\n".join("".join(row) for row in grid)
+
+
+def day24(rng: random.Random, scale: float) -> str:
+    # All hailstones are hit by one rock thrown from `pos` with velocity `vel`.
+    pos = [rng.randint(150_000_000_000_000, 450_000_000_000_000) for _ in range(3)]
+    vel = [rng.randint(-300, 300) for _ in range(3)]
+    lines = []
+    times = rng.sample(range(1, 1_000_000_000_000), scaled(300, scale))
+    for t in times:
+        v = [rng.randint(-300, 300) for _ in range(3)]
+        p = [p0 + t * (v0 - v1) for p0, v0, v1 in zip(pos, vel, v)]
+        lines.append(", ".join(map(str, p)) + " @ " + ", ".join(map(str, v)))
+    return "\n".join(lines)
+
+
+def day25(rng: random.Random, scale: float) -> str:
+    # Two well connected components of random sizes joined by three edges.
+    total = scaled(1500, scale)
+    nodes = names(rng, total, string.ascii_lowercase, 3 if total < 10000 else 4)
+    split = rng.randint(total // 3, 2 * total // 3)
+    edges = set[tuple[str, str]]()
+    for part in (nodes[:split], nodes[split:]):
+        for u, v in zip(part, part[1:] + part[:1]):
+            edges.add((u, v))
+        for u in part:
+            for v in rng.sample(part, 3):
+                if u != v and (v, u) not in edges:
+                    edges.add((u, v))
+    # Three distinct ones, as two that coincide would leave a cut of two.
+    crossing = set[tuple[str, str]]()
+    while len(crossing) < 3:
+        crossing.add((rng.choice(nodes[:split]), rng.choice(nodes[split:])))
+    edges |= crossing
+    adjacency: dict[str, list[str]] = {}
+    for u, v in edges:
+        adjacency.setdefault(u, []).append(v)
+    return "\n".join(f"{u}: {' '.join(vs)}" for u, vs in adjacency.items())
+
+
+GENERATORS: dict[str, Generator] = {
+    name: value for name, value in globals().items() if re.fullmatch(r"day\d\d", name)
+}
+
+
+def generate(day: str, scale: float = 1.0, seed: int = 0) -> str:
+    return GENERATORS[day](random.Random(f"{day}/{scale}/{seed}"), scale) + "\n"
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        prog="python -m generators",
+        description="Write a random input for a day to stdout.",
+    )
+    parser.add_argument("day", choices=sorted(GENERATORS), metavar="DAY")
+    parser.add_argument("-s", "--scale", type=float, default=1.0)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    sys.stdout.write(generate(args.day, args.scale, args.seed))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,277 @@
+from __future__ import annotations
+import math
+from array import array
+from bisect import bisect_left
+from collections.abc import Container, Iterable
+from dataclasses import dataclass, field
+from heapq import heappop, heappush
+from profiling import count, maximum
+import selftest
+
+# Graphs over the nodes 0..size-1 in compressed sparse row form: the arcs leaving
+# node v are targets[offsets[v]:offsets[v + 1]], with the matching weights if the
+# graph has any. Days map their own nodes to integers once and then hand the
+# graph to the kernels below. The kernels count the work they do with profiling.
+
+
+@dataclass
+class Graph:
+    offsets: array[int]
+    targets: array[int]
+    weights: array[int] | None = None
+    unpacked: tuple[list[list[int]], list[list[int]] | None] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    @staticmethod
+    def build(
+        size: int,
+        edges: Iterable[tuple[int, int]] | Iterable[tuple[int, int, int]],
+        symmetric: bool = False,
+    ) -> Graph:
+        arcs = list[tuple[int, ...]](edges)
+        if symmetric:
+            arcs += [(v, u, *w) for (u, v, *w) in arcs]
+        arcs.sort()
+        tails = [arc[0] for arc in arcs]
+        offsets = array("i", [bisect_left(tails, v) for v in range(size + 1)])
+        targets = array("i", [arc[1] for arc in arcs])
+        weighted = len(arcs) > 0 and len(arcs[0]) == 3
+        weights = array("i", [arc[2] for arc in arcs]) if weighted else None
+        return Graph(offsets, targets, weights)
+
+    @property
+    def size(self) -> int:
+        return len(self.offsets) - 1
+
+    def adjacency(self) -> tuple[list[list[int]], list[list[int]] | None]:
+        # The kernels walk per node lists of targets and weights, unpacked from
+        # the arrays once per graph. Reading an array element boxes a new int
+        # every time, which made repeated searches slower than the dicts of
+        # lists the days used before.
+        if self.unpacked is None:
+            offsets = self.offsets.tolist()
+            bounds = list(zip(offsets, offsets[1:]))
+            targets = self.targets.tolist()
+            weights = None if self.weights is None else self.weights.tolist()
+            self.unpacked = (
+                [targets[i:j] for (i, j) in bounds],
+                None if weights is None else [weights[i:j] for (i, j) in bounds],
+            )
+        return self.unpacked
+
+    def __getstate__(self) -> dict[str, object]:
+        # Pickles leave out the unpacked lists, which are bigger than the arrays.
+        return self.__dict__ | {"unpacked": None}
+
+
+def dfs(graph: Graph, sources: Iterable[int], banned: Iterable[int] = ()) -> list[int]:
+    # All nodes reachable from the sources without entering a banned node, in
+    # the order they were found.
+    (adjacency, _) = graph.adjacency()
+    seen = bytearray(graph.size)
+    for node in banned:
+        seen[node] = 1
+    found = []
+    for node in sources:
+        if not seen[node]:
+            seen[node] = 1
+            found.append(node)
+    stack = found.copy()
+    while stack:
+        node = stack.pop()
+        for dest in adjacency[node]:
+            if not seen[dest]:
+                seen[dest] = 1
+                found.append(dest)
+                stack.append(dest)
+    count("expanded", len(found))
+    return found
+
+
+def dijkstra(graph: Graph, sources: Iterable[int], targets: Container[int]) -> int:
+    (adjacency, weights) = graph.adjacency()
+    costs = weights or [[1] * len(dests) for dests in adjacency]
+    size = graph.size
+    cheapest = [math.inf] * size
+    # Queue entries are cost * size + node, which saves a tuple per push.
+    queue = list[int]()
+    for node in sources:
+        cheapest[node] = 0
+        heappush(queue, node)
+    (expanded, pushes, stale) = (0, len(queue), 0)
+    result = -1
+    while queue:
+        (node_cost, node) = divmod(heappop(queue), size)
+        if node_cost > cheapest[node]:
+            stale += 1
+            continue
+        if node in targets:
+            result = node_cost
+            break
+        expanded += 1
+        for dest, cost in zip(adjacency[node], costs[node]):
+            dest_cost = node_cost + cost
+            if dest_cost < cheapest[dest]:
+                cheapest[dest] = dest_cost
+                heappush(queue, dest_cost * size + dest)
+                pushes += 1
+    count("expanded", expanded)
+    count("heap pushes", pushes)
+    count("stale pops", stale)
+    if result < 0:
+        raise Exception("target not found")
+    return result
+
+
+def longest_path(graph: Graph, source: int, target: int) -> int:
+    # Tries every simple path from source to target, so the graph had better be
+    # small or narrow. The stack holds the nodes still to enter, each with the
+    # length of the path to it, and a marker ~node under the nodes entered from
+    # a node to leave it again once they are done. Returns -1 if there is no
+    # path at all.
+    (adjacency, weights) = graph.adjacency()
+    costs = weights or [[1] * len(dests) for dests in adjacency]
+    arcs = [list(zip(dests, cost)) for (dests, cost) in zip(adjacency, costs)]
+    # Once next to the target, a path can only end there if that is its one way
+    # in, so that's the only arc worth trying.
+    entries = [node for node in range(graph.size) if target in adjacency[node]]
+    if len(entries) == 1:
+        [entry] = entries
+        arcs[entry] = [(dest, cost) for (dest, cost) in arcs[entry] if dest == target]
+    if source == target:
+        count("paths", 1)
+        return 0
+    # The target is never entered, so a path that reaches it ends there.
+    on_path = bytearray(graph.size)
+    on_path[target] = 1
+    stack = [(source, 0)]
+    depth = 0
+    # Counting every step would slow the search down noticeably, so only the
+    # paths that reach the target are counted, along with the deepest of them.
+    (result, paths, deepest) = (-1, 0, 0)
+    while stack:
+        (node, dist) = stack.pop()
+        if node < 0:
+            on_path[~node] = 0
+            depth -= 1
+            continue
+        on_path[node] = 1
+        depth += 1
+        stack.append((~node, 0))
+        for dest, cost in arcs[node]:
+            if not on_path[dest]:
+                stack.append((dest, dist + cost))
+            elif dest == target:
+                result = max(result, dist + cost)
+                paths += 1
+                deepest = max(deepest, depth)
+    count("paths", paths)
+    maximum("depth", deepest)
+    return result
+
+
+def minimum_cut(
+    graph: Graph, source: int, sink: int, limit: float = math.inf
+) -> tuple[int, bytearray]:
+    # Minimum source-sink cut of an undirected graph, i.e. one built with
+    # `symmetric=True`, found as a maximum flow by augmenting along shortest
+    # paths. Returns the cut's capacity and which nodes are on the source side.
+    # Stops early once the flow exceeds `limit`, as the side is moot then.
+    (offsets, targets) = (graph.offsets.tolist(), graph.targets.tolist())
+    capacity = [1] * len(targets) if graph.weights is None else graph.weights.tolist()
+    # Each arc's flow is the negative of that of its reverse arc.
+    reverse = array("i", bytes(4 * len(targets)))
+    unpaired = dict[tuple[int, int], list[int]]()
+    for u in range(graph.size):
+        for arc in range(offsets[u], offsets[u + 1]):
+            v = targets[arc]
+            if unpaired.get((v, u)):
+                back = unpaired[v, u].pop()
+                (reverse[arc], reverse[back]) = (back, arc)
+            else:
+                unpaired.setdefault((u, v), []).append(arc)
+    flow = array("i", bytes(4 * len(targets)))
+    (total, expanded, paths) = (0, 0, 0)
+    while True:
+        parent = array("i", [-1]) * graph.size
+        seen = bytearray(graph.size)
+        seen[source] = 1
+        queue = [source]
+        for node in queue:
+            if node == sink:
+                break
+            for arc in range(offsets[node], offsets[node + 1]):
+                dest = targets[arc]
+                if not seen[dest] and flow[arc] < capacity[arc]:
+                    seen[dest] = 1
+                    parent[dest] = arc
+                    queue.append(dest)
+        expanded += len(queue)
+        if not seen[sink]:
+            break
+        path = []
+        node = sink
+        while node != source:
+            arc = parent[node]
+            path.append(arc)
+            node = targets[reverse[arc]]
+        push = min(capacity[arc] - flow[arc] for arc in path)
+        for arc in path:
+            flow[arc] += push
+            flow[reverse[arc]] -= push
+        total += push
+        paths += 1
+        if total > limit:
+            break
+    count("expanded", expanded)
+    count("augmenting paths", paths)
+    return (total, seen)
+
+
+@selftest.register
+def test_dfs() -> None:
+    graph = Graph.build(5, [(0, 1), (1, 2), (2, 3), (0, 4), (4, 3)])
+    assert sorted(dfs(graph, [0])) == [0, 1, 2, 3, 4]
+    assert sorted(dfs(graph, [0], banned=[2])) == [0, 1, 3, 4]
+    assert dfs(graph, [0], banned=[0]) == []
+
+
+@selftest.register
+def test_dijkstra() -> None:
+    graph = Graph.build(5, [(0, 1, 1), (1, 2, 1), (0, 2, 5), (2, 3, 1)])
+    assert dijkstra(graph, [0], {3}) == 3
+    assert dijkstra(graph, [0, 2], {3}) == 1
+    try:
+        dijkstra(graph, [0], {4})
+        assert False, "an unreachable target must raise"
+    except Exception as exc:
+        assert str(exc) == "target not found"
+
+
+@selftest.register
+def test_longest_path() -> None:
+    # A square 0-1-3-2 with the diagonal 1-2, and a tail 3-4.
+    edges = [(0, 1, 1), (1, 3, 1), (0, 2, 2), (2, 3, 2), (1, 2, 5), (3, 4, 1)]
+    graph = Graph.build(6, edges, symmetric=True)
+    assert longest_path(graph, 0, 3) == 8
+    assert longest_path(graph, 0, 4) == 9
+    assert longest_path(graph, 4, 0) == 9
+    assert longest_path(graph, 0, 0) == 0
+    assert longest_path(graph, 0, 5) == -1
+
+
+@selftest.register
+def test_minimum_cut() -> None:
+    # Two triangles joined by a single edge.
+    edges = [(0, 1), (1, 2), (2, 0), (3, 4), (4, 5), (5, 3), (2, 3)]
+    graph = Graph.build(6, edges, symmetric=True)
+    (size, side) = minimum_cut(graph, 0, 5)
+    assert size == 1
+    assert list(side) == [1, 1, 1, 0, 0, 0]
+    (size, _) = minimum_cut(graph, 0, 1)
+    assert size == 2
+
+
+if __name__ == "__main__":
+    selftest.run(__name__)
@@ -0,0 +1,59 @@
+from __future__ import annotations
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+
+# A grid keeps its cells row by row in one flat bytearray, surrounded by a border
+# of one cell on every side. Cells are addressed by their index into that array,
+# so a neighbour is always at a fixed offset and stepping off the grid lands on
+# a border cell instead of needing a bounds check.
+
+# Directions, in the order of the offsets returned by `Grid.offsets`.
+RIGHT = 0
+UP = 1
+LEFT = 2
+DOWN = 3
+
+
+@dataclass
+class Grid:
+    cells: bytearray
+    rows: int
+    cols: int
+
+    @classmethod
+    def parse(cls, lines: Iterable[str], border: str = "#") -> Grid:
+        data = [line.rstrip() for line in lines]
+        data = [line for line in data if line]
+        (rows, cols) = (len(data), len(data[0]))
+        edge = border * (cols + 2)
+        text = edge + "".join(f"{border}{line}{border}" for line in data) + edge
+        return Grid(bytearray(text, "ascii"), rows, cols)
+
+    @classmethod
+    def filled(cls, rows: int, cols: int, fill: int = 0, border: int = 0xFF) -> Grid:
+        grid = Grid(bytearray([border]) * ((rows + 2) * (cols + 2)), rows, cols)
+        for row in range(rows):
+            start = grid.index(row, 0)
+            grid.cells[start : start + cols] = bytes([fill]) * cols
+        return grid
+
+    @property
+    def stride(self) -> int:
+        return self.cols + 2
+
+    def offsets(self) -> tuple[int, int, int, int]:
+        return (1, -self.stride, -1, self.stride)
+
+    def index(self, row: int, col: int) -> int:
+        return (row + 1) * self.stride + col + 1
+
+    def find(self, char: str) -> int:
+        index = self.cells.find(ord(char))
+        if index < 0:
+            raise ValueError(f"{char!r} not found")
+        return index
+
+    def inside(self) -> Iterator[int]:
+        for row in range(self.rows):
+            start = self.index(row, 0)
+            yield from range(start, start + self.cols)
@@ -0,0 +1,67 @@
+from __future__ import annotations
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+import runner
+
+# Executed in a fresh interpreter per solver so that every import is a cold one.
+PROBE = """
+import json, sys, time
+import selftest
+start = time.perf_counter()
+__import__(sys.argv[1])
+imported = time.perf_counter()
+selftest.run(sys.argv[1])
+tested = time.perf_counter()
+print(json.dumps([imported - start, tested - imported]))
+"""
+
+
+def measure(name: str, repeat: int) -> tuple[float, float] | None:
+    best: tuple[float, float] | None = None
+    env = os.environ | {"PYTHONPATH": runner.PYTHON_DIR}
+    for _ in range(repeat):
+        proc = subprocess.run(
+            [sys.executable, "-c", PROBE, name],
+            cwd=runner.ROOT_DIR,
+            env=env,
+            capture_output=True,
+            text=True,
+        )
+        if proc.returncode != 0:
+            return None
+        (import_time, test_time) = json.loads(proc.stdout.splitlines()[-1])
+        if best is None or import_time < best[0]:
+            best = (import_time, test_time)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        prog="python -m importbench",
+        description="Compare the import time of each solver with the time its "
+        "example checks take, which every import used to pay for.",
+    )
+    parser.add_argument("patterns", nargs="*", metavar="DAY")
+    parser.add_argument("-n", "--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'solver':8}  {'import':>8}  {'checks':>9}  {'saving':>6}")
+    for name in runner.discover(args.patterns):
+        times = measure(name, args.repeat)
+        if times is None:
+            print(f"{name:8}  {'failed':>8}")
+            continue
+        (import_time, test_time) = times
+        saving = test_time / (import_time + test_time)
+        print(
+            f"{name:8}  {1000 * import_time:8.2f}  {1000 * test_time:9.2f}  "
+            f"{100 * saving:5.1f}%"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+from __future__ import annotations
+import contextlib
+import time
+import tracemalloc
+from typing import Any
+
+# Solvers mark the phases of their work, e.g. `with phase("parse"):`. Unless the
+# runner enabled profiling, `phase` hands back a shared do-nothing context, so
+# the markers can stay in the code for good. When enabled, every phase adds up
+# its time and number of calls, keyed by the phases it is nested in. In memory
+# mode it also records the peak of the memory traced by tracemalloc while it ran.
+#
+# Searches also report how much work they did, e.g. how many nodes they
+# expanded, with `count` and `maximum`. They tally in local variables and report
+# once per call, so the counters are always on and cost next to nothing.
+
+NULL = contextlib.nullcontext()
+
+# Total seconds, number of calls and peak traced bytes of a phase.
+type Stats = tuple[float, int, int]
+
+enabled = False
+tracing = False
+stack = list[str]()
+totals = dict[tuple[str, ...], list[Any]]()  # [seconds, calls, peak]
+# Peaks of the phases that are running, and of the whole run at the bottom.
+peaks = list[list[int]]()
+counters = dict[str, int]()
+
+
+def observe() -> None:
+    # tracemalloc only keeps one peak, so every phase boundary hands it to the
+    # phases still running and starts a new one.
+    peak = tracemalloc.get_traced_memory()[1]
+    for running in peaks:
+        running[0] = max(running[0], peak)
+    tracemalloc.reset_peak()
+
+
+class Phase:
+    __slots__ = ("name", "total", "start")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.total: list[Any] = []
+        self.start = 0.0
+
+    def __enter__(self) -> None:
+        stack.append(self.name)
+        # Creating the entry on the way in lists phases in the order they began.
+        self.total = totals.setdefault(tuple(stack), [0.0, 0, 0])
+        if tracing:
+            observe()
+            peaks.append([0])
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc: object) -> None:
+        self.total[0] += time.perf_counter() - self.start
+        self.total[1] += 1
+        if tracing:
+            observe()
+            self.total[2] = max(self.total[2], peaks.pop()[0])
+        stack.pop()
+
+
+def phase(name: str) -> contextlib.AbstractContextManager[None]:
+    return Phase(name) if enabled else NULL
+
+
+def count(name: str, n: int = 1) -> None:
+    counters[name] = counters.get(name, 0) + n
+
+
+def maximum(name: str, value: int) -> None:
+    counters[name] = max(counters.get(name, value), value)
+
+
+def take_counters() -> dict[str, int]:
+    result = dict(counters)
+    counters.clear()
+    return result
+
+
+def enable(memory: bool = False) -> None:
+    global enabled, tracing
+    (enabled, tracing) = (True, memory)
+    stack.clear()
+    totals.clear()
+    if memory:
+        peaks[:] = [[0]]
+        tracemalloc.start()
+
+
+def memory_usage() -> tuple[int, int]:
+    # The peak of the traced memory since `enable(memory=True)`, and the number
+    # of blocks still allocated, e.g. by caches that outlive the run.
+    observe()
+    return (peaks[0][0], len(tracemalloc.take_snapshot().traces))
+
+
+def collect() -> dict[str, Stats]:
+    # Stops profiling and returns the phases seen since `enable`, as paths like
+    # "build;compress" mapped to their stats.
+    global enabled, tracing
+    if tracing:
+        tracemalloc.stop()
+    (enabled, tracing) = (False, False)
+    result = {";".join(key): (t[0], t[1], t[2]) for key, t in totals.items()}
+    totals.clear()
+    return result
+
+
+def folded(root: str, total: float, phases: dict[str, Stats]) -> list[str]:
+    # Collapsed stacks as read by flamegraph.pl, inferno or speedscope: one line
+    # per phase with the time spent in it but outside its child phases, in µs.
+    # Time outside any phase goes to the root frame.
+    own = {path: seconds for path, (seconds, _, _) in phases.items()}
+    own[""] = total
+    for path, (seconds, _, _) in phases.items():
+        (parent, _, _) = path.rpartition(";")
+        if parent in own:
+            own[parent] -= seconds
+    lines = []
+    for path, seconds in own.items():
+        if seconds > 0:
+            frames = f"{root};{path}" if path else root
+            lines.append(f"{frames} {round(1e6 * seconds)}")
+    return lines
@@ -0,0 +1,53 @@
+from __future__ import annotations
+import mmap
+import os
+import re
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+# Solvers whose `solve` takes `bytes` instead of a text reader get their input
+# from here. The file is memory-mapped instead of read and decoded, and lines are
+# handed out as memoryview slices of it, so nothing is copied until a solver asks
+# for a value. An mmap quacks enough like bytes for that.
+#
+# `load` is a context manager: `with rawinput.load(path) as data: ...`.
+
+INT_RE = re.compile(rb"-?\d+")
+
+
+@contextmanager
+def load(path: str) -> Iterator[bytes]:
+    # The mapping is closed on leaving the block, so nothing may hold on to it.
+    with open(path, "rb") as file:
+        if os.fstat(file.fileno()).st_size == 0:  # Empty files can't be mapped.
+            yield b""
+            return
+        data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            yield data  # type: ignore
+        finally:
+            try:
+                data.close()
+            except BufferError:  # A view of it is still alive, e.g. in an error.
+                pass
+
+
+def lines(data: bytes) -> Iterator[memoryview]:
+    view = memoryview(data)
+    (start, size) = (0, len(data))
+    while start < size:
+        end = data.find(b"\n", start)
+        if end < 0:
+            end = size
+        yield view[start:end]
+        start = end + 1
+
+
+def fields(line: bytes | memoryview, sep: bytes | None = None) -> list[bytes]:
+    # Like bytes.split, which is far quicker than anything done over the view.
+    # The copy is one line long.
+    return bytes(line).split(sep)
+
+
+def ints(data: bytes | memoryview) -> list[int]:
+    return list(map(int, INT_RE.findall(data)))
@@ -0,0 +1,280 @@
+from __future__ import annotations
+import hashlib
+import marshal
+import os
+import pickle
+import re
+import sys
+from collections.abc import Callable
+from types import CodeType, FunctionType, ModuleType
+import selftest
+
+# An on-disk cache of answers and parsed inputs, keyed by the hash of the input
+# and of the code that produced them. The code of a function is its bytecode, its
+# default arguments and closed-over values, plus that of every function, class,
+# constant and local module it refers to, so editing a solver's search leaves its
+# cached parse valid, while editing the parse, a regex, table or default it uses,
+# or moving it to other lines does not.
+# Entries are pickles named after their key, and the least recently used ones
+# are deleted once the directory grows past `max_bytes`.
+#
+# Nothing is cached until the runner calls `enable`, so solvers run as scripts
+# or in tests always compute everything.
+
+PYTHON_DIR = os.path.dirname(os.path.abspath(__file__))
+MISSING = object()
+SCALARS = {type(None), bool, int, float, complex, str, bytes}
+
+directory: str | None = None
+max_bytes = 0
+
+
+def enable(path: str, size: int) -> None:
+    global directory, max_bytes
+    os.makedirs(path, exist_ok=True)
+    (directory, max_bytes) = (path, size)
+
+
+def is_local(module: ModuleType | None) -> bool:
+    file = getattr(module, "__file__", None)
+    return file is not None and os.path.dirname(os.path.abspath(file)) == PYTHON_DIR
+
+
+def is_array(obj: object) -> bool:
+    # NumPy arrays, without importing NumPy.
+    return hasattr(obj, "dtype") and hasattr(obj, "tobytes")
+
+
+def is_internal(obj: object) -> bool:
+    # What Python adds to classes on its own: accessors for the fields of named
+    # tuples and slotted classes, which say nothing beyond the annotations, and
+    # the bookkeeping of abstract base classes.
+    return type(obj).__name__ in ("member_descriptor", "_tuplegetter", "_abc_data")
+
+
+def code_hash(func: Callable[..., object]) -> bytes:
+    digest = hashlib.sha256()
+    seen = set[int]()
+
+    def visit_code(code: CodeType, names: dict[str, object]) -> None:
+        for name in code.co_names:
+            if name in names:
+                visit(names[name])
+        for const in code.co_consts:
+            if isinstance(const, CodeType):
+                visit_code(const, names)
+
+    def visit(obj: object) -> None:
+        if isinstance(obj, (staticmethod, classmethod)):
+            obj = obj.__func__
+        if type(obj) in SCALARS:
+            digest.update(repr(obj).encode())
+            return
+        if id(obj) in seen:
+            return
+        seen.add(id(obj))
+        if isinstance(obj, ModuleType):
+            if is_local(obj):
+                with open(obj.__file__ or "", "rb") as file:
+                    digest.update(file.read())
+                # Also the tables it built on import, which its file may not
+                # show, e.g. when they are patched.
+                for value in vars(obj).values():
+                    if isinstance(value, re.Pattern) or is_array(value):
+                        visit(value)
+            return
+        if isinstance(obj, (tuple, list, dict)) and {*map(type, obj)} <= SCALARS:
+            if not isinstance(obj, dict) or {*map(type, obj.values())} <= SCALARS:
+                digest.update(repr(obj).encode())
+                return
+        if isinstance(obj, (tuple, list)):
+            digest.update(f"{type(obj).__name__} {len(obj)}".encode())
+            for item in obj:
+                visit(item)
+            return
+        if isinstance(obj, dict):
+            digest.update(f"dict {len(obj)}".encode())
+            for k, value in obj.items():
+                visit(k)
+                visit(value)
+            return
+        if isinstance(obj, (set, frozenset)):
+            # Sorted, as the order of a set of strings changes from run to run.
+            digest.update(repr(sorted(map(repr, obj))).encode())
+            return
+        if isinstance(obj, re.Pattern):
+            digest.update(repr((obj.pattern, obj.flags)).encode())
+            return
+        if is_array(obj):
+            digest.update(repr((str(obj.dtype), obj.shape)).encode())  # type: ignore
+            digest.update(obj.tobytes())  # type: ignore
+            return
+        module = sys.modules.get(getattr(obj, "__module__", None) or "")
+        if isinstance(obj, FunctionType):
+            if is_local(module):
+                digest.update(marshal.dumps(obj.__code__))
+                # Default arguments and closed-over values are not in the code.
+                visit(obj.__defaults__)
+                visit(obj.__kwdefaults__)
+                for cell in obj.__closure__ or ():
+                    try:
+                        visit(cell.cell_contents)
+                    except ValueError:  # Not assigned yet.
+                        digest.update(b"empty cell")
+                visit_code(obj.__code__, obj.__globals__)
+        elif isinstance(obj, property):
+            for func in (obj.fget, obj.fset, obj.fdel):
+                visit(func)
+        elif isinstance(obj, type):
+            if is_local(module):
+                digest.update(obj.__qualname__.encode())
+                digest.update(repr(vars(obj).get("__annotations__")).encode())
+                # Methods and class attributes, e.g. the defaults of fields.
+                for name, value in vars(obj).items():
+                    if not name.startswith("__") and not is_internal(value):
+                        visit(name)
+                        visit(value)
+                for base in obj.__bases__:
+                    visit(base)
+        elif callable(obj):
+            # Library functions are not ours to hash, but what they wrap may be,
+            # e.g. a function under functools.cache.
+            visit(getattr(obj, "__wrapped__", None))
+        else:
+            # Any other constant counts by its type and value. A repr with an
+            # address in it never matches again, which is safe if wasteful.
+            visit(type(obj))
+            try:
+                digest.update(pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL))
+            except Exception:
+                digest.update(repr(obj).encode())
+
+    visit(func)
+    return digest.digest()
+
+
+def key(*parts: bytes) -> str:
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(len(part).to_bytes(8, "little"))
+        digest.update(part)
+    return digest.hexdigest()
+
+
+def entry_path(key: str) -> str:
+    assert directory is not None
+    return os.path.join(directory, f"{key}.pickle")
+
+
+def load(key: str) -> object:
+    if directory is None:
+        return MISSING
+    path = entry_path(key)
+    try:
+        with open(path, "rb") as file:
+            value = pickle.load(file)
+    except (OSError, pickle.UnpicklingError, EOFError):
+        return MISSING
+    try:
+        os.utime(path)  # Marks the entry as recently used.
+    except FileNotFoundError:  # Another worker evicted it meanwhile.
+        pass
+    return value
+
+
+def store(key: str, value: object) -> None:
+    if directory is None:
+        return
+    path = entry_path(key)
+    temp = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(temp, "wb") as file:
+            pickle.dump(value, file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp, path)
+    except BaseException:  # E.g. a value that does not pickle.
+        if os.path.exists(temp):
+            os.remove(temp)
+        raise
+    evict()
+
+
+def evict() -> None:
+    assert directory is not None
+    entries = []
+    for entry in os.scandir(directory):
+        if entry.name.endswith(".pickle"):
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:  # Another worker evicted it meanwhile.
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+    total = sum(size for (_, size, _) in entries)
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        try:
+            os.remove(path)
+        except FileNotFoundError:  # Another worker got there first.
+            pass
+        total -= size
+
+
+def cached[I: (str, bytes), T](parse: Callable[[I], T], input: I) -> T:
+    # Returns `parse(input)`, from the cache if possible. `parse` must be a plain
+    # function of the input alone.
+    if directory is None:
+        return parse(input)
+    data = input.encode() if isinstance(input, str) else input
+    k = key(b"parse", code_hash(parse), data)
+    value = load(k)
+    if value is MISSING:
+        value = parse(input)
+        store(k, value)
+    return value  # type: ignore
+
+
+@selftest.register
+def test_key_follows_globals() -> None:
+    def solve(text: str) -> bool:
+        return RULE_RE.fullmatch(text) is not None
+
+    def with_rule(pattern: str) -> bytes:
+        # The same code, seeing another regex.
+        names = {"__name__": __name__, "RULE_RE": re.compile(pattern)}
+        return code_hash(FunctionType(solve.__code__, names))
+
+    assert with_rule("a") == with_rule("a")
+    assert with_rule("a") != with_rule("a?")
+
+
+@selftest.register
+def test_key_follows_defaults_and_closures() -> None:
+    def make(scale: int) -> Callable[..., int]:
+        def solve(text: str, streaming: bool = False) -> int:
+            return scale * len(text) + streaming
+
+        return solve
+
+    before = code_hash(make(1))
+    assert code_hash(make(1)) == before
+    assert code_hash(make(2)) != before
+    solve = make(1)
+    solve.__defaults__ = (True,)
+    assert code_hash(solve) != before
+
+
+@selftest.register
+def test_key_follows_class_attributes() -> None:
+    class Limits:
+        steps = 64
+
+    def solve(text: str) -> int:
+        return Limits.steps * len(text)
+
+    before = code_hash(solve)
+    Limits.steps = 65
+    assert code_hash(solve) != before
+
+
+if __name__ == "__main__":
+    selftest.run(__name__)
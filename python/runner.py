@@ -0,0 +1,481 @@
+from __future__ import annotations
+import argparse
+import contextlib
+import cProfile
+import importlib
+import inspect
+import io
+import json
+import math
+import os
+import re
+import sys
+import time
+import traceback
+from collections.abc import Callable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from types import ModuleType
+
+import profiling
+import rawinput
+import resultcache
+import selftest
+
+PYTHON_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT_DIR = os.path.dirname(PYTHON_DIR)
+SOLVER_RE = re.compile(r"(day\d\d)[a-z]")
+CACHE_DIR = os.path.join(ROOT_DIR, ".cache")
+
+# Solvers whose `solve` takes an extra argument besides the input. The value
+# names the module constant their `main` passes along.
+PARAMS = {
+    "day11b": "EXPANSION",
+    "day21a": "STEPS",
+    "day24a": "RANGE",
+    "day24b": "RANGE",
+}
+
+# Shared modules with example checks of their own, which --self-test runs after
+# those of the solvers.
+LIBRARIES = ["graph", "resultcache"]
+
+
+@dataclass
+class Result:
+    name: str
+    answer: int | None
+    error: str | None
+    import_time: float
+    # None for solvers that parse bytes without marking a "parse" phase.
+    parse_time: float | None
+    solve_time: float
+    # Time, number of calls and peak memory of each phase marked in `solve`, if
+    # profiled.
+    phases: dict[str, profiling.Stats] = field(default_factory=dict)
+    # Peak traced memory of `solve` and the blocks still allocated after it, if
+    # run in memory mode. These are live blocks, not a count of allocations.
+    peak_memory: int | None = None
+    live_blocks: int | None = None
+    # Work done by the searches in `solve`, e.g. the number of nodes expanded.
+    counters: dict[str, int] = field(default_factory=dict)
+    # Whether the answer came from the cache instead of `solve`.
+    cached: bool = False
+
+    @property
+    def wall_time(self) -> float:
+        return self.import_time + (self.parse_time or 0.0) + self.solve_time
+
+
+@dataclass(frozen=True)
+class Options:
+    # Time the phases marked in `solve`.
+    phases: bool = False
+    # Trace the memory allocated by `solve` and its phases.
+    memory: bool = False
+    # Run `solve` under cProfile and write its stats to this directory.
+    cprofile: str | None = None
+    # Reuse answers and parsed inputs cached in this directory, which is kept
+    # below `cache_size` bytes.
+    cache: str | None = None
+    cache_size: int = 64 * 2**20
+
+
+def discover(patterns: list[str] | None = None) -> list[str]:
+    names = sorted(
+        name
+        for file in os.listdir(PYTHON_DIR)
+        if file.endswith(".py") and SOLVER_RE.fullmatch(name := file[:-3])
+    )
+    return matching(names, patterns)
+
+
+def matching(names: list[str], patterns: list[str] | None) -> list[str]:
+    if patterns:
+        names = [name for name in names if any(name.startswith(p) for p in patterns)]
+    return names
+
+
+def input_path(name: str) -> str:
+    m = SOLVER_RE.match(name)
+    assert m is not None, f"not a solver: {name}"
+    return os.path.join(ROOT_DIR, "input", f"{m[1]}.txt")
+
+
+def solve_args(module: ModuleType, name: str) -> tuple[object, ...]:
+    param = PARAMS.get(name)
+    return () if param is None else (getattr(module, param),)
+
+
+def input_type(module: ModuleType) -> object:
+    [param, *_] = inspect.signature(module.solve).parameters.values()
+    return {"str": str, "bytes": bytes}.get(param.annotation, param.annotation)
+
+
+@contextlib.contextmanager
+def open_input(module: ModuleType, path: str) -> Iterator[object]:
+    # Solvers get their input as a text reader, except those whose `solve` asks
+    # for the whole text (day15) or for raw bytes.
+    kind = input_type(module)
+    if kind is bytes:
+        with rawinput.load(path) as data:
+            yield data
+        return
+    with open(path) as file:
+        text = file.read()
+    yield text if kind is str else io.StringIO(text)
+
+
+def clear_caches(module: ModuleType) -> None:
+    for value in vars(module).values():
+        if callable(getattr(value, "cache_clear", None)):
+            value.cache_clear()
+
+
+def prepare(name: str, text: str | None = None) -> Callable[[], int]:
+    module = importlib.import_module(name)
+    if text is None:
+        with open(input_path(name)) as file:
+            text = file.read()
+    args = solve_args(module, name)
+    kind = input_type(module)
+    data = text.encode()
+
+    def call() -> int:
+        # Repeated calls should all start cold, e.g. day12b's `possibilities`.
+        clear_caches(module)
+        if kind is bytes:
+            input = data
+        elif kind is str:
+            input = text
+        else:
+            input = io.StringIO(text)
+        with contextlib.redirect_stdout(io.StringIO()):
+            return module.solve(input, *args)
+
+    return call
+
+
+def answer_key(module: ModuleType, name: str, path: str) -> str:
+    with open(path, "rb") as file:
+        data = file.read()
+    return resultcache.key(
+        b"answer",
+        resultcache.code_hash(module.solve),
+        repr(solve_args(module, name)).encode(),
+        data,
+    )
+
+
+def run_solver(
+    name: str, options: Options = Options(), path: str | None = None
+) -> Result:
+    # Solves the input at `path`, by default the day's own. Profiling adds
+    # overhead to the solve time, and a cached answer leaves only the time it
+    # took to look it up.
+    path = path or input_path(name)
+    result = Result(name, None, None, 0.0, 0.0, 0.0)
+    # Some solvers print diagnostics, which must not end up in our report.
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            module = importlib.import_module(name)
+            result.import_time = time.perf_counter() - start
+
+            key = None
+            if options.cache is not None:
+                start = time.perf_counter()
+                resultcache.enable(options.cache, options.cache_size)
+                key = answer_key(module, name, path)
+                answer = resultcache.load(key)
+                if answer is not resultcache.MISSING:
+                    (result.answer, result.cached) = (answer, True)  # type: ignore
+                    result.solve_time = time.perf_counter() - start
+                    return result
+
+            # Text is read and decoded up front, which is what the parse column
+            # shows for text solvers. Bytes are only mapped, and parsed as the
+            # solver goes, so for them it shows the phase they mark as "parse".
+            raw = input_type(module) is bytes
+            profiled = options.phases or options.memory or raw
+            start = time.perf_counter()
+            with open_input(module, path) as input:
+                result.parse_time = None if raw else time.perf_counter() - start
+                args = (input, *solve_args(module, name))
+                profiler = None if options.cprofile is None else cProfile.Profile()
+                if profiled:
+                    profiling.enable(options.memory)
+                profiling.take_counters()
+                try:
+                    start = time.perf_counter()
+                    if profiler is None:
+                        result.answer = module.solve(*args)
+                    else:
+                        result.answer = profiler.runcall(module.solve, *args)
+                    result.solve_time = time.perf_counter() - start
+                finally:
+                    if options.memory:
+                        usage = profiling.memory_usage()
+                        (result.peak_memory, result.live_blocks) = usage
+                    phases = profiling.collect() if profiled else {}
+                    if options.phases or options.memory:
+                        result.phases = phases
+                    result.counters = profiling.take_counters()
+            if raw and "parse" in phases:
+                result.parse_time = phases["parse"][0]
+                result.solve_time -= result.parse_time
+            if profiler is not None:
+                assert options.cprofile is not None
+                profiler.dump_stats(os.path.join(options.cprofile, f"{name}.prof"))
+            if key is not None:
+                resultcache.store(key, result.answer)
+    except Exception as exc:
+        result.error = "".join(traceback.format_exception_only(exc)).strip()
+    return result
+
+
+def run_self_tests(name: str) -> tuple[int, str | None]:
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            importlib.import_module(name)
+            tests = selftest.TESTS.get(name, [])
+            for test in tests:
+                test()
+        return (len(tests), None)
+    except Exception as exc:
+        return (0, "".join(traceback.format_exception_only(exc)).strip())
+
+
+def setup_path() -> None:
+    if PYTHON_DIR not in sys.path:
+        sys.path.insert(0, PYTHON_DIR)
+
+
+def load_timings(path: str) -> dict[str, float]:
+    with open(path) as file:
+        data = json.load(file)
+    return {solver["name"]: solver["wall_time"] for solver in data["solvers"]}
+
+
+def run_all(
+    names: list[str],
+    jobs: int = 1,
+    timings: dict[str, float] | None = None,
+    options: Options = Options(),
+) -> list[Result]:
+    if jobs == 1:
+        return [run_solver(name, options) for name in names]
+    # Start the slowest solvers first so they don't end up queueing behind each
+    # other at the end. Solvers without a previous timing count as slow.
+    timings = timings or {}
+    order = sorted(names, key=lambda name: -timings.get(name, math.inf))
+    with ProcessPoolExecutor(max_workers=jobs, initializer=setup_path) as pool:
+        futures = {name: pool.submit(run_solver, name, options) for name in order}
+        results = []
+        for name in names:
+            try:
+                results.append(futures[name].result())
+            except Exception as exc:
+                error = "".join(traceback.format_exception_only(exc)).strip()
+                results.append(Result(name, None, error, 0.0, 0.0, 0.0))
+        return results
+
+
+def align(
+    rows: list[tuple[str, ...]], rules_after: set[int], text: tuple[int, ...] = (0, 1)
+) -> str:
+    # Columns are right-aligned, except the `text` ones.
+    widths = [max(len(row[i]) for row in rows) for i in range(len(rows[0]))]
+    lines = []
+    for k, row in enumerate(rows):
+        cells = [
+            cell.ljust(width) if i in text else cell.rjust(width)
+            for i, (cell, width) in enumerate(zip(row, widths))
+        ]
+        lines.append("  ".join(cells).rstrip())
+        if k in rules_after:
+            lines.append("  ".join("-" * width for width in widths))
+    return "\n".join(lines)
+
+
+def mib(size: int | None) -> str:
+    return "-" if size is None else f"{size / 2**20:.1f}"
+
+
+def format_table(results: list[Result], memory: bool = False) -> str:
+    total = sum(r.wall_time for r in results)
+    header = ("solver", "answer", "import", "parse", "solve", "wall", "share")
+    header += ("peak MiB", "live blocks") * memory + ("work",)
+    rows = [header]
+    for r in results:
+        answer = str(r.answer) if r.error is None else f"ERROR: {r.error}"
+        row = (
+            r.name,
+            answer if len(answer) <= 40 else answer[:37] + "...",
+            f"{1000 * r.import_time:.1f}",
+            "-" if r.parse_time is None else f"{1000 * r.parse_time:.1f}",
+            f"{1000 * r.solve_time:.1f}" + (" cached" if r.cached else ""),
+            f"{1000 * r.wall_time:.1f}",
+            f"{100 * r.wall_time / total:.1f}%" if total > 0 else "-",
+        )
+        if memory:
+            blocks = "-" if r.live_blocks is None else str(r.live_blocks)
+            row += (mib(r.peak_memory), blocks)
+        row += (" ".join(f"{name}={n}" for name, n in r.counters.items()),)
+        rows.append(row)
+    rows.append(
+        ("total", "", "", "", "", f"{1000 * total:.1f}") + ("",) * (len(header) - 6)
+    )
+    return align(rows, rules_after={0, len(rows) - 2}, text=(0, 1, len(header) - 1))
+
+
+def format_phases(results: list[Result], memory: bool = False) -> str:
+    rows = [("solver", "phase", "calls", "time", "share") + ("peak MiB",) * memory]
+    for r in results:
+        for path, (seconds, calls, peak) in r.phases.items():
+            share = seconds / r.solve_time if r.solve_time > 0 else 0
+            depth = path.count(";")
+            row = (
+                r.name,
+                "  " * depth + path.rpartition(";")[2],
+                str(calls),
+                f"{1000 * seconds:.1f}",
+                f"{100 * share:.1f}%",
+            )
+            rows.append(row + (mib(peak),) * memory)
+    return align(rows, rules_after={0})
+
+
+def over_budget(results: list[Result], budget: float) -> list[str]:
+    return [r.name for r in results if (r.peak_memory or 0) > budget]
+
+
+def to_json(results: list[Result], elapsed: float) -> dict[str, object]:
+    return {
+        "solvers": [asdict(r) | {"wall_time": r.wall_time} for r in results],
+        "total_time": sum(r.wall_time for r in results),
+        "elapsed_time": elapsed,
+    }
+
+
+def positive_int(text: str) -> int:
+    value = int(text)
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1: {text}")
+    return value
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        prog="python -m runner", description="Run and time the solvers."
+    )
+    parser.add_argument(
+        "patterns", nargs="*", metavar="DAY", help="solver name prefix, e.g. day16"
+    )
+    parser.add_argument("--json", metavar="PATH", help="also write results as JSON")
+    parser.add_argument(
+        "--self-test",
+        action="store_true",
+        help="run the registered example checks instead of the real inputs",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=positive_int,
+        default=1,
+        metavar="N",
+        help="run solvers in N worker processes",
+    )
+    parser.add_argument(
+        "--schedule",
+        metavar="PATH",
+        help="JSON of a previous run, used to start the slowest solvers first",
+    )
+    parser.add_argument(
+        "--phases",
+        action="store_true",
+        help="time the phases each solver marks and list them after the table",
+    )
+    parser.add_argument(
+        "--folded",
+        metavar="PATH",
+        help="write the phases as collapsed stacks for flame graph tools",
+    )
+    parser.add_argument(
+        "--cprofile",
+        metavar="DIR",
+        help="run each solve under cProfile and write DIR/<solver>.prof",
+    )
+    parser.add_argument(
+        "--cache",
+        nargs="?",
+        const=CACHE_DIR,
+        metavar="DIR",
+        help="reuse answers and parsed inputs whose input and code are unchanged",
+    )
+    parser.add_argument(
+        "--cache-size",
+        type=int,
+        default=64,
+        metavar="MIB",
+        help="drop the least recently used cache entries beyond this size",
+    )
+    parser.add_argument(
+        "--memory",
+        action="store_true",
+        help="trace the peak memory of each solver and of its phases",
+    )
+    parser.add_argument(
+        "--memory-budget",
+        type=float,
+        metavar="MIB",
+        help="trace memory and fail if a solver's peak goes over MIB",
+    )
+    args = parser.parse_args()
+
+    setup_path()
+    if args.self_test:
+        failed = False
+        for name in discover(args.patterns) + matching(LIBRARIES, args.patterns):
+            (count, error) = run_self_tests(name)
+            failed |= error is not None
+            print(f"{name}  {f'FAILED: {error}' if error else f'{count} passed'}")
+        sys.exit(1 if failed else 0)
+
+    jobs = args.jobs
+    timings = None if args.schedule is None else load_timings(args.schedule)
+    memory = args.memory or args.memory_budget is not None
+    options = Options(
+        phases=args.phases or args.folded is not None,
+        memory=memory,
+        cprofile=args.cprofile,
+        cache=args.cache,
+        cache_size=args.cache_size * 2**20,
+    )
+    if args.cprofile is not None:
+        os.makedirs(args.cprofile, exist_ok=True)
+    start = time.perf_counter()
+    results = run_all(discover(args.patterns), jobs, timings, options)
+    elapsed = time.perf_counter() - start
+    print(format_table(results, memory))
+    print(f"elapsed: {1000 * elapsed:.1f} ms with {jobs} job(s)")
+    if args.phases or memory:
+        print()
+        print(format_phases(results, memory))
+    if args.folded is not None:
+        with open(args.folded, "w") as file:
+            for r in results:
+                for line in profiling.folded(r.name, r.solve_time, r.phases):
+                    file.write(line + "\n")
+    if args.json is not None:
+        with open(args.json, "w") as file:
+            json.dump(to_json(results, elapsed), file, indent=2)
+            file.write("\n")
+    if args.memory_budget is not None:
+        if over := over_budget(results, args.memory_budget * 2**20):
+            print(f"over {args.memory_budget:g} MiB: {', '.join(over)}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
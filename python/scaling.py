@@ -0,0 +1,143 @@
+from __future__ import annotations
+import argparse
+import math
+import os
+import subprocess
+import sys
+import tempfile
+from dataclasses import dataclass
+
+import generators
+import runner
+
+# Executed in a fresh interpreter per measurement, so that a solver which blows
+# up on a large input can be stopped without taking the benchmark down with it.
+PROBE = """
+import sys, time
+import runner
+with open(sys.argv[2]) as file:
+    call = runner.prepare(sys.argv[1], file.read())
+start = time.perf_counter()
+call()
+print(time.perf_counter() - start)
+"""
+
+
+@dataclass
+class Point:
+    scale: float
+    size: int
+    time: float | None
+    error: str | None
+
+
+def measure(name: str, scale: float, seed: int, timeout: float) -> Point:
+    day = runner.SOLVER_RE.match(name)[1]  # type: ignore
+    try:
+        text = generators.generate(day, scale, seed)
+    except Exception as exc:
+        return Point(scale, 0, None, f"generator failed: {exc}")
+    with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False) as file:
+        file.write(text)
+    try:
+        proc = subprocess.run(
+            [sys.executable, "-c", PROBE, name, file.name],
+            cwd=runner.ROOT_DIR,
+            env=os.environ | {"PYTHONPATH": runner.PYTHON_DIR},
+            capture_output=True,
+            text=True,
+            timeout=timeout,
+        )
+    except subprocess.TimeoutExpired:
+        return Point(scale, len(text), None, f"timeout after {timeout:g}s")
+    finally:
+        os.unlink(file.name)
+    if proc.returncode != 0:
+        error = (proc.stderr.strip().splitlines() or ["failed"])[-1]
+        return Point(scale, len(text), None, error)
+    return Point(scale, len(text), float(proc.stdout.splitlines()[-1]), None)
+
+
+def exponent(points: list[Point]) -> float | None:
+    # Least squares fit of log(time) against log(size).
+    xy = [(math.log(p.size), math.log(p.time)) for p in points if p.time]
+    if len(xy) < 2:
+        return None
+    mx = sum(x for x, _ in xy) / len(xy)
+    my = sum(y for _, y in xy) / len(xy)
+    var = sum((x - mx) ** 2 for x, _ in xy)
+    return sum((x - mx) * (y - my) for x, y in xy) / var if var > 0 else None
+
+
+def plot(path: str, series: dict[str, list[Point]]) -> None:
+    import matplotlib.pyplot as plt
+
+    (fig, ax) = plt.subplots()
+    for name, points in series.items():
+        done = [p for p in points if p.time is not None]
+        ax.plot([p.size for p in done], [p.time for p in done], "o-", label=name)
+    ax.set_xscale("log")
+    ax.set_yscale("log")
+    ax.set_xlabel("input size [bytes]")
+    ax.set_ylabel("solve time [s]")
+    ax.legend()
+    fig.savefig(path)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        prog="python -m scaling",
+        description="Time solvers on generated inputs of growing size.",
+    )
+    parser.add_argument("patterns", nargs="*", metavar="DAY")
+    parser.add_argument(
+        "-s", "--scales", type=float, nargs="+", default=[1, 2, 5, 10], metavar="S"
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--timeout", type=float, default=60.0, help="seconds per measurement"
+    )
+    parser.add_argument("--csv", metavar="PATH", help="also write the points as CSV")
+    parser.add_argument(
+        "--plot", metavar="PATH", help="plot time against size (needs matplotlib)"
+    )
+    args = parser.parse_args()
+
+    # Baselines such as day01b_naive are no solvers, but can be named in full.
+    names = runner.discover(args.patterns)
+    names += [
+        p
+        for p in args.patterns
+        if p not in names
+        and runner.SOLVER_RE.match(p)
+        and os.path.exists(os.path.join(runner.PYTHON_DIR, f"{p}.py"))
+    ]
+    series: dict[str, list[Point]] = {}
+    for name in names:
+        points = []
+        print(f"{name}:")
+        for scale in args.scales:
+            point = measure(name, scale, args.seed, args.timeout)
+            points.append(point)
+            result = point.error or f"{1000 * point.time:10.1f} ms"  # type: ignore
+            print(f"  scale {scale:>6g}  {point.size:>12} bytes  {result}")
+            if point.error is not None:
+                break
+        k = exponent(points)
+        if k is not None:
+            print(f"  time grows like size^{k:.2f}")
+        series[name] = points
+
+    if args.csv is not None:
+        with open(args.csv, "w") as file:
+            file.write("solver,scale,size,time,error\n")
+            for name, points in series.items():
+                for p in points:
+                    time = "" if p.time is None else p.time
+                    file.write(f"{name},{p.scale},{p.size},{time},{p.error or ''}\n")
+    if args.plot is not None:
+        plot(args.plot, series)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+from __future__ import annotations
+import re
+from bisect import bisect_left
+from collections import deque
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from typing import NamedTuple
+from grid import Grid
+
+# The engine schematic of day 3, indexed in one pass over its cells: every run
+# of digits gets an id and its value, every cell of the run holds that id, and
+# every symbol knows the ids of the numbers around it. Both parts and similar
+# questions are then a walk over the symbols.
+#
+# Schematics too big for that can be streamed instead, see `stream`.
+
+NUMBER_RE = re.compile(rb"\d+")
+SYMBOL_RE = re.compile(rb"[^.\d]")
+
+
+@dataclass
+class Schematic:
+    grid: Grid
+    labels: list[int]  # Id of the number covering each cell, -1 if none.
+    values: list[int]  # Value of each number, by id.
+    adjacent: dict[int, list[int]]  # Ids of the numbers around each symbol.
+
+    @staticmethod
+    def parse(lines: Iterable[str]) -> Schematic:
+        # The border of dots keeps the numbers of different rows apart and the
+        # neighbours of every symbol inside the grid.
+        grid = Grid.parse(lines, border=".")
+        labels = [-1] * len(grid.cells)
+        values = []
+        for m in NUMBER_RE.finditer(grid.cells):
+            (start, end) = m.span()
+            labels[start:end] = [len(values)] * (end - start)
+            values.append(int(m[0]))
+        stride = grid.stride
+        around = [dr * stride + dc for dr in (-1, 0, 1) for dc in (-1, 0, 1)]
+        adjacent = {}
+        for m in SYMBOL_RE.finditer(grid.cells):
+            pos = m.start()
+            ids = {labels[pos + offset] for offset in around}
+            ids.discard(-1)
+            adjacent[pos] = sorted(ids)
+        return Schematic(grid, labels, values, adjacent)
+
+    def part_numbers(self) -> list[int]:
+        # Numbers next to at least one symbol, each once.
+        ids = {id for ids in self.adjacent.values() for id in ids}
+        return [self.values[id] for id in sorted(ids)]
+
+    def gears(self, parts: int = 2, symbol: str = "*") -> Iterator[list[int]]:
+        # The numbers around each `symbol` that has exactly `parts` of them.
+        code = ord(symbol)
+        for pos, ids in self.adjacent.items():
+            if self.grid.cells[pos] == code and len(ids) == parts:
+                yield [self.values[id] for id in ids]
+
+
+class Row(NamedTuple):
+    cells: bytes
+    # The numbers of the row, as [start, end) spans into the cells.
+    starts: list[int]
+    ends: list[int]
+    values: list[int]
+
+    @staticmethod
+    def parse(line: str) -> Row:
+        cells = ("." + line.strip()).encode()
+        row = Row(cells, [], [], [])
+        for m in NUMBER_RE.finditer(cells):
+            row.starts.append(m.start())
+            row.ends.append(m.end())
+            row.values.append(int(m[0]))
+        return row
+
+
+EMPTY_ROW = Row(b"", [], [], [])
+
+
+def stream(lines: Iterable[str], parts: int = 2) -> Iterator[tuple[int, int]]:
+    # Reads the schematic a row at a time and yields, for every row, the sum of
+    # its part numbers and of the products of the numbers around its stars with
+    # exactly `parts` of them, as soon as the next row is in. Only three rows
+    # are kept at any time, so memory only grows with the width.
+    window = deque([EMPTY_ROW], maxlen=3)
+    for line in lines:
+        if line.strip():
+            window.append(Row.parse(line))
+            if len(window) == 3:
+                yield scan(*window, parts)
+    if len(window) >= 2:
+        window.append(EMPTY_ROW)
+        yield scan(*window, parts)
+
+
+def scan(above: Row, row: Row, below: Row, parts: int) -> tuple[int, int]:
+    window = (above, row, below)
+    numbers = 0
+    for start, end, value in zip(row.starts, row.ends, row.values):
+        if any(SYMBOL_RE.search(r.cells, start - 1, end + 1) for r in window):
+            numbers += value
+    ratios = 0
+    col = row.cells.find(b"*")
+    while col != -1:
+        around = []
+        for r in window:
+            i = bisect_left(r.ends, col)  # The first number ending at or after col.
+            while i < len(r.starts) and r.starts[i] <= col + 1:
+                around.append(r.values[i])
+                i += 1
+        if len(around) == parts:
+            ratio = 1
+            for value in around:
+                ratio *= value
+            ratios += ratio
+        col = row.cells.find(b"*", col + 1)
+    return (numbers, ratios)
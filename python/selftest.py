@@ -0,0 +1,15 @@
+from collections.abc import Callable
+
+type Test = Callable[[], None]
+
+TESTS: dict[str, list[Test]] = {}
+
+
+def register(test: Test) -> Test:
+    TESTS.setdefault(test.__module__, []).append(test)
+    return test
+
+
+def run(module: str) -> None:
+    for test in TESTS.get(module, []):
+        test()
@@ -0,0 +1,65 @@
+from __future__ import annotations
+from array import array
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+
+# The desert network of day 8, compiled for walking: nodes are numbered in the
+# order of their lines, with a table of left and right successors. The first
+# walk to start a pass over the instructions at some node follows the tables
+# step by step and remembers where that pass leads and which nodes ending in Z
+# it passes on the way. Every later pass from that node takes one lookup, and
+# only the nodes that walks actually start passes at are ever compiled.
+
+
+@dataclass
+class Network:
+    names: list[str]
+    ids: dict[str, int]
+    left: array
+    right: array
+    # The successor table to use at each step of a pass.
+    steps: list[array]
+    targets: bytearray  # 1 for the nodes ending in Z.
+    # Node after a pass over the instructions from a node, and the targets the
+    # pass reaches as (step, node) in step order, for the nodes compiled so far.
+    passes: dict[int, tuple[int, list[tuple[int, int]]]] = field(
+        default_factory=dict, repr=False
+    )
+
+    @staticmethod
+    def parse(text: str) -> Network:
+        [dirs, _, *lines] = text.splitlines()
+        lines = [line for line in lines if line.strip()]
+        names = [line[0:3] for line in lines]
+        ids = {name: id for (id, name) in enumerate(names)}
+        left = array("i", [ids[line[7:10]] for line in lines])
+        right = array("i", [ids[line[12:15]] for line in lines])
+        steps = [left if dir == "L" else right for dir in dirs.strip()]
+        targets = bytearray(name.endswith("Z") for name in names)
+        return Network(names, ids, left, right, steps, targets)
+
+    def run(self, id: int) -> tuple[int, list[tuple[int, int]]]:
+        # A pass over the instructions from `id`.
+        compiled = self.passes.get(id)
+        if compiled is None:
+            (node, hits) = (id, list[tuple[int, int]]())
+            for step, successors in enumerate(self.steps, 1):
+                node = successors[node]
+                if self.targets[node]:
+                    hits.append((step, node))
+            compiled = self.passes[id] = (node, hits)
+        return compiled
+
+    def walk(self, start: str) -> Iterator[tuple[int, int]]:
+        # The steps at which a walk from `start` reaches a node ending in Z and
+        # that node, forever.
+        id = self.ids[start]
+        if start.endswith("Z"):
+            yield (0, id)
+        count = 0
+        while True:
+            (next, hits) = self.run(id)
+            for step, target in hits:
+                yield (count + step, target)
+            id = next
+            count += len(self.steps)